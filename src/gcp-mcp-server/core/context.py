@@ -11,9 +11,39 @@ from google.cloud import (
     bigquery,
     compute_v1,
     monitoring_v3,
+    run_v2,
     storage,
 )
+from google.cloud.monitoring_v3.services.alert_policy_service.transports import (
+    AlertPolicyServiceGrpcAsyncIOTransport,
+    AlertPolicyServiceGrpcTransport,
+)
+from google.cloud.monitoring_v3.services.metric_service.transports import (
+    MetricServiceGrpcTransport,
+)
+from google.cloud.monitoring_v3.services.notification_channel_service.transports import (
+    NotificationChannelServiceGrpcTransport,
+)
+from google.cloud.run_v2.services.revisions.transports import (
+    RevisionsGrpcAsyncIOTransport,
+)
+from google.cloud.run_v2.services.services.transports import (
+    ServicesGrpcAsyncIOTransport,
+)
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+
+# Channel options for long-lived gRPC clients: keep the HTTP/2 connection warm
+# between tool calls instead of re-handshaking after idle periods
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# Connection pool size for HTTP/JSON clients; the requests default of 10 makes
+# concurrent tool calls queue for (and re-handshake) connections
+HTTP_POOL_SIZE = 100
 
 
 class GCPClients:
@@ -29,8 +59,14 @@ class GCPClients:
         self._storage_client = None
         self._bigquery_client = None
         self._run_client = None
+        self._run_async_client = None
+        self._run_revisions_async_client = None
         self._logging_client = None
+        self._monitoring_channel = None
         self._monitoring_client = None
+        self._monitoring_alerts_client = None
+        self._monitoring_alerts_async_client = None
+        self._monitoring_channels_client = None
         self._compute_client = None
         self._sql_client = None
         self._cloudbuild_client = None
@@ -124,7 +160,16 @@ class GCPClients:
 
     @property
     def storage(self) -> storage.Client:
-        self._storage_client = self._init_client(storage.Client, self._storage_client)
+        """Get the Cloud Storage client on an enlarged keep-alive connection pool."""
+        if not self._storage_client:
+            client = self._init_client(storage.Client, None)
+            client._http.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+                ),
+            )
+            self._storage_client = client
         return self._storage_client
 
     @property
@@ -151,6 +196,132 @@ class GCPClients:
                 )
         return self._artifactregistry_client
 
+    def _monitoring_grpc_channel(self):
+        """Get the tuned gRPC channel shared by the Cloud Monitoring clients."""
+        if not self._monitoring_channel:
+            self._monitoring_channel = MetricServiceGrpcTransport.create_channel(
+                f"{MetricServiceGrpcTransport.DEFAULT_HOST}:443",
+                credentials=self.credentials,
+                options=GRPC_CHANNEL_OPTIONS,
+            )
+        return self._monitoring_channel
+
+    @property
+    def monitoring(self) -> monitoring_v3.MetricServiceClient:
+        """Get the Cloud Monitoring metrics client on a tuned gRPC channel."""
+        if not self._monitoring_client:
+            try:
+                self._monitoring_client = monitoring_v3.MetricServiceClient(
+                    transport=MetricServiceGrpcTransport(
+                        channel=self._monitoring_grpc_channel()
+                    )
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize MetricServiceClient: {str(e)}"
+                )
+        return self._monitoring_client
+
+    @property
+    def monitoring_alerts(self) -> monitoring_v3.AlertPolicyServiceClient:
+        """Get the Cloud Monitoring alert policy client, sharing the metrics channel."""
+        if not self._monitoring_alerts_client:
+            try:
+                self._monitoring_alerts_client = monitoring_v3.AlertPolicyServiceClient(
+                    transport=AlertPolicyServiceGrpcTransport(
+                        channel=self._monitoring_grpc_channel()
+                    )
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize AlertPolicyServiceClient: {str(e)}"
+                )
+        return self._monitoring_alerts_client
+
+    @property
+    def monitoring_alerts_async(self) -> monitoring_v3.AlertPolicyServiceAsyncClient:
+        """Get the asyncio Cloud Monitoring alert policy client.
+
+        The underlying grpc.aio channel binds to the running event loop, so
+        this must first be accessed from inside the server's loop.
+        """
+        if not self._monitoring_alerts_async_client:
+            try:
+                channel = AlertPolicyServiceGrpcAsyncIOTransport.create_channel(
+                    f"{AlertPolicyServiceGrpcAsyncIOTransport.DEFAULT_HOST}:443",
+                    credentials=self.credentials,
+                    options=GRPC_CHANNEL_OPTIONS,
+                )
+                self._monitoring_alerts_async_client = (
+                    monitoring_v3.AlertPolicyServiceAsyncClient(
+                        transport=AlertPolicyServiceGrpcAsyncIOTransport(
+                            channel=channel
+                        )
+                    )
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize AlertPolicyServiceAsyncClient: {str(e)}"
+                )
+        return self._monitoring_alerts_async_client
+
+    @property
+    def monitoring_channels(self) -> monitoring_v3.NotificationChannelServiceClient:
+        """Get the Cloud Monitoring notification channel client, sharing the metrics channel."""
+        if not self._monitoring_channels_client:
+            try:
+                self._monitoring_channels_client = (
+                    monitoring_v3.NotificationChannelServiceClient(
+                        transport=NotificationChannelServiceGrpcTransport(
+                            channel=self._monitoring_grpc_channel()
+                        )
+                    )
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize NotificationChannelServiceClient: {str(e)}"
+                )
+        return self._monitoring_channels_client
+
+    @property
+    def run_async(self) -> run_v2.ServicesAsyncClient:
+        """Get the asyncio Cloud Run services client.
+
+        The underlying grpc.aio channel binds to the running event loop, so
+        this must first be accessed from inside the server's loop.
+        """
+        if not self._run_async_client:
+            try:
+                channel = ServicesGrpcAsyncIOTransport.create_channel(
+                    f"{ServicesGrpcAsyncIOTransport.DEFAULT_HOST}:443",
+                    credentials=self.credentials,
+                    options=GRPC_CHANNEL_OPTIONS,
+                )
+                self._run_async_client = run_v2.ServicesAsyncClient(
+                    transport=ServicesGrpcAsyncIOTransport(channel=channel)
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize ServicesAsyncClient: {str(e)}"
+                )
+        return self._run_async_client
+
+    @property
+    def run_revisions_async(self) -> run_v2.RevisionsAsyncClient:
+        """Get the asyncio Cloud Run revisions client, sharing the services channel."""
+        if not self._run_revisions_async_client:
+            try:
+                self._run_revisions_async_client = run_v2.RevisionsAsyncClient(
+                    transport=RevisionsGrpcAsyncIOTransport(
+                        channel=self.run_async.transport.grpc_channel
+                    )
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize RevisionsAsyncClient: {str(e)}"
+                )
+        return self._run_revisions_async_client
+
     # Uncomment and implement other client properties as needed
     # @property
     # def storage(self) -> storage.Client:
@@ -193,13 +364,6 @@ class Context:
     #     )
     #     return self._logging_client
 
-    @property
-    def monitoring(self) -> monitoring_v3.MetricServiceClient:
-        self._monitoring_client = self._init_client(
-            monitoring_v3.MetricServiceClient, self._monitoring_client
-        )
-        return self._monitoring_client
-
     @property
     def compute(self) -> compute_v1.InstancesClient:
         self._compute_client = self._init_client(
@@ -79,6 +79,9 @@ mcp = FastMCP(
         "google-cloud-monitoring",
         "google-cloud-compute",
         "google-cloud-build",
+        "orjson",
+        "cachetools",
+        "google-crc32c",
     ],
 )
 
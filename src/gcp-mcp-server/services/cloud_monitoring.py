@@ -1,12 +1,264 @@
-import datetime
-import json
-from typing import Dict, List, Optional
-
+import asyncio
+import base64
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from textwrap import dedent
+from typing import Any, Dict, Final, List, Optional
+
+import orjson
+import proto
+from cachetools import TTLCache
+from google.api import metric_pb2
 from google.cloud import monitoring_v3
+from google.protobuf import json_format
 from google.protobuf.duration_pb2 import Duration
 from google.protobuf.timestamp_pb2 import Timestamp
+from mcp.server.fastmcp.prompts.base import Message, Prompt, UserMessage
 from services import client_instances
 
+logger = logging.getLogger(__name__)
+
+# Largest page the list RPCs accept, so big projects need fewer round-trips
+_PAGE_SIZE = 1000
+
+# Descriptors, policies and channels change on a minutes-to-hours timescale,
+# so repeated listings are served from memory for a few minutes
+_METRIC_CACHE = TTLCache(maxsize=64, ttl=300)
+_ALERT_POLICY_CACHE = TTLCache(maxsize=64, ttl=300)
+_CHANNEL_CACHE = TTLCache(maxsize=64, ttl=300)
+# Serialized single-policy responses, kept briefly to absorb repeated reads
+_ALERT_CACHE = TTLCache(maxsize=256, ttl=30)
+
+# Enum number -> name tables, built once instead of reflecting per row
+_METRIC_KIND = {
+    value.number: value.name
+    for value in metric_pb2.MetricDescriptor.MetricKind.DESCRIPTOR.values
+}
+_VALUE_TYPE = {
+    value.number: value.name
+    for value in metric_pb2.MetricDescriptor.ValueType.DESCRIPTOR.values
+}
+_COMBINER = {
+    member.value: member.name
+    for member in monitoring_v3.AlertPolicy.ConditionCombinerType
+}
+_VERIFICATION = {
+    member.value: member.name
+    for member in monitoring_v3.NotificationChannel.VerificationStatus
+}
+
+# Enum name -> member tables for validating tool arguments without reflection
+_COMPARISON_BY_NAME = {member.name: member for member in monitoring_v3.ComparisonType}
+_ALIGNER_BY_NAME = {member.name: member for member in monitoring_v3.Aggregation.Aligner}
+_REDUCER_BY_NAME = {member.name: member for member in monitoring_v3.Aggregation.Reducer}
+
+# TypedValue oneof field -> point value extractor
+_VALUE_GETTERS = {
+    "double_value": attrgetter("double_value"),
+    "int64_value": attrgetter("int64_value"),
+    "bool_value": attrgetter("bool_value"),
+    "string_value": attrgetter("string_value"),
+    # Simplified, as distributions are complex
+    "distribution_value": lambda value: "distribution",
+}
+
+
+# orjson options shared by every response this module emits
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Tool error response laid out exactly as _dumps would emit it, so the error
+# path only has to escape the message
+_ERR_TPL = '{{\n  "status": "error",\n  "message": {msg}\n}}'
+
+# Prompt bodies are static, so they are trimmed and interned once at import
+_CREATE_ALERT_PROMPT: Final[str] = sys.intern(
+    dedent(
+        """
+        I need to create a new alert policy in Cloud Monitoring.
+
+        Please help me with:
+        1. Selecting the appropriate metric type for my alert
+        2. Setting up sensible thresholds and durations
+        3. Understanding the different comparison types
+        4. Best practices for alert documentation
+        5. Setting up notification channels
+
+        I'd like to create an alert that triggers when:
+        """
+    ).strip()
+)
+
+_MONITOR_RESOURCES_PROMPT: Final[str] = sys.intern(
+    dedent(
+        """
+        I need to set up monitoring for my GCP resources. Please help me understand:
+
+        1. What are the most important metrics I should be monitoring for:
+           - Compute Engine instances
+           - Cloud SQL databases
+           - Cloud Storage buckets
+           - App Engine applications
+           - Kubernetes Engine clusters
+
+        2. What are recommended thresholds for alerts on these resources?
+
+        3. How should I organize my monitoring to keep it manageable?
+
+        4. What visualization options do I have in Cloud Monitoring?
+        """
+    ).strip()
+)
+
+
+class _StaticPrompt(Prompt):
+    """A prompt with a fixed body, rendered without calling a handler."""
+
+    messages: List[Message]
+
+    async def render(self, arguments=None, context=None) -> List[Message]:
+        return self.messages
+
+
+def _static_prompt(name: str, description: str, body: str) -> _StaticPrompt:
+    """Build a prompt whose message list is created once and reused per request."""
+    return _StaticPrompt(
+        name=name,
+        description=description,
+        arguments=[],
+        fn=lambda: body,
+        messages=[UserMessage(body)],
+    )
+
+
+# Listing rows are slotted dataclasses, which orjson serializes natively
+# without building an intermediate dict per row
+@dataclass(slots=True)
+class _MetricRow:
+    name: str
+    type: str
+    display_name: str
+    description: str
+    kind: Optional[str]
+    value_type: Optional[str]
+    unit: str
+
+
+@dataclass(slots=True)
+class _AlertPolicyRow:
+    name: str
+    display_name: str
+    enabled: bool
+    conditions_count: int
+    combiner: Optional[str]
+    notification_channels: List[str]
+    creation_time: Optional[datetime]
+
+
+def _enum_name(table: Dict[int, str], value: int) -> Optional[str]:
+    """Look up an enum name, treating the zero/unspecified value as None."""
+    return table.get(value) if value else None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively.
+
+    proto-plus returns timestamps as DatetimeWithNanoseconds, a datetime
+    subclass that orjson only accepts through this hook.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool/resource result as indented JSON."""
+    return orjson.dumps(obj, default=_json_default, option=_JSON_OPTS).decode()
+
+
+def _error(e: BaseException) -> str:
+    """Render a tool error response for an exception."""
+    return _ERR_TPL.format(msg=orjson.dumps(str(e)).decode())
+
+
+def _to_dict(message: Any) -> Dict[str, Any]:
+    """Convert a protobuf message to a JSON-ready dict via json_format."""
+    if isinstance(message, proto.Message):
+        message = type(message).pb(message)
+    return json_format.MessageToDict(message, preserving_proto_field_name=True)
+
+
+@lru_cache(maxsize=128)
+def _aggregation(
+    period_seconds: int, aligner: int, reducer: int = 0
+) -> monitoring_v3.Aggregation:
+    """Build (once per shape) an Aggregation for the given period/aligner/reducer.
+
+    Callers must not mutate the result; proto-plus copies it when it is
+    assigned into a request or condition, so passing it directly is safe.
+    """
+    return monitoring_v3.Aggregation(
+        alignment_period=Duration(seconds=period_seconds),
+        per_series_aligner=aligner,
+        cross_series_reducer=reducer,
+    )
+
+
+def _labels(message: Any) -> Dict[str, str]:
+    """Copy a message's labels map, reading the underlying protobuf MapField."""
+    if isinstance(message, proto.Message):
+        message = type(message).pb(message)
+    return dict(message.labels)
+
+
+def _proto_result(response: proto.Message) -> str:
+    """Return a response message as base64 wire-format protobuf for machine callers."""
+    return _dumps(
+        {
+            "status": "success",
+            "format": "proto",
+            "message_type": type(response).pb().DESCRIPTOR.full_name,
+            "data": base64.b64encode(type(response).serialize(response)).decode(),
+        }
+    )
+
+
+def _list_metric_rows(
+    client, project_id: str, filter_str: str = ""
+) -> List[_MetricRow]:
+    """List metric descriptor summaries, served from _METRIC_CACHE while fresh."""
+    key = (project_id, filter_str)
+    rows = _METRIC_CACHE.get(key)
+    if rows is None:
+        request = monitoring_v3.ListMetricDescriptorsRequest(
+            name=f"projects/{project_id}", filter=filter_str, page_size=_PAGE_SIZE
+        )
+        rows = [
+            _MetricRow(
+                metric.name,
+                metric.type,
+                metric.display_name,
+                metric.description,
+                _METRIC_KIND.get(metric.metric_kind),
+                _VALUE_TYPE.get(metric.value_type),
+                metric.unit,
+            )
+            for metric in client.list_metric_descriptors(request=request)
+        ]
+        _METRIC_CACHE[key] = rows
+    return rows
+
+
+def _invalidate_alerts(project_id: str, *alert_ids: str) -> None:
+    """Drop cached alert policy listings (and the given policies) after a mutation."""
+    for key in [key for key in _ALERT_POLICY_CACHE if key[0] == project_id]:
+        _ALERT_POLICY_CACHE.pop(key, None)
+    for alert_id in alert_ids:
+        _ALERT_CACHE.pop((project_id, alert_id), None)
+
 
 def register(mcp_instance):
     """Register all Cloud Monitoring resources and tools with the MCP instance."""
@@ -20,229 +272,116 @@ def register(mcp_instance):
             client = client_instances.get_clients().monitoring
             project_id = project_id or client_instances.get_project_id()
 
-            name = f"projects/{project_id}"
-            metrics = client.list_metric_descriptors(name=name)
-
-            result = []
-            for metric in metrics:
-                result.append(
-                    {
-                        "name": metric.name,
-                        "type": metric.type,
-                        "display_name": metric.display_name,
-                        "description": metric.description,
-                        "kind": monitoring_v3.MetricDescriptor.MetricKind.Name(
-                            metric.metric_kind
-                        ),
-                        "value_type": monitoring_v3.MetricDescriptor.ValueType.Name(
-                            metric.value_type
-                        ),
-                        "unit": metric.unit,
-                    }
-                )
+            result = _list_metric_rows(client, project_id)
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource("gcp://monitoring/{project_id}/alerts")
     def list_alerts_resource(project_id: str = None) -> str:
         """List all alert policies for a GCP project"""
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_alerts
             project_id = project_id or client_instances.get_project_id()
 
             name = f"projects/{project_id}"
-            policies = client.list_alert_policies(name=name)
+            request = monitoring_v3.ListAlertPoliciesRequest(
+                name=name, page_size=_PAGE_SIZE
+            )
+            policies = client.list_alert_policies(request=request)
 
-            result = []
-            for policy in policies:
-                result.append(
-                    {
-                        "name": policy.name,
-                        "display_name": policy.display_name,
-                        "enabled": policy.enabled,
-                        "conditions_count": len(policy.conditions),
-                        "creation_time": policy.creation_record.mutate_time.ToDatetime().isoformat()
-                        if policy.creation_record and policy.creation_record.mutate_time
-                        else None,
-                        "notification_channels": [
-                            chan.split("/")[-1] for chan in policy.notification_channels
-                        ]
-                        if policy.notification_channels
-                        else [],
-                    }
-                )
+            result = [_to_dict(policy) for policy in policies]
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource("gcp://monitoring/{project_id}/alert/{alert_id}")
     def get_alert_resource(project_id: str = None, alert_id: str = None) -> str:
         """Get details for a specific alert policy"""
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_alerts
             project_id = project_id or client_instances.get_project_id()
 
+            key = (project_id, alert_id)
+            cached = _ALERT_CACHE.get(key)
+            if cached is not None:
+                return cached
+
             name = f"projects/{project_id}/alertPolicies/{alert_id}"
             policy = client.get_alert_policy(name=name)
 
-            conditions = []
-            for condition in policy.conditions:
-                condition_data = {
-                    "name": condition.name,
-                    "display_name": condition.display_name,
-                    "type": condition.condition_type_name
-                    if hasattr(condition, "condition_type_name")
-                    else None,
-                }
-
-                # Add condition-specific details
-                if condition.HasField("condition_threshold"):
-                    threshold = condition.condition_threshold
-                    condition_data["threshold"] = {
-                        "filter": threshold.filter,
-                        "comparison": monitoring_v3.ComparisonType.Name(
-                            threshold.comparison
-                        )
-                        if threshold.comparison
-                        else None,
-                        "threshold_value": threshold.threshold_value,
-                        "duration": f"{threshold.duration.seconds}s"
-                        if threshold.duration
-                        else None,
-                        "aggregation": {
-                            "alignment_period": f"{threshold.aggregations[0].alignment_period.seconds}s"
-                            if threshold.aggregations
-                            and threshold.aggregations[0].alignment_period
-                            else None,
-                            "per_series_aligner": monitoring_v3.Aggregation.Aligner.Name(
-                                threshold.aggregations[0].per_series_aligner
-                            )
-                            if threshold.aggregations
-                            and threshold.aggregations[0].per_series_aligner
-                            else None,
-                            "cross_series_reducer": monitoring_v3.Aggregation.Reducer.Name(
-                                threshold.aggregations[0].cross_series_reducer
-                            )
-                            if threshold.aggregations
-                            and threshold.aggregations[0].cross_series_reducer
-                            else None,
-                        }
-                        if threshold.aggregations and len(threshold.aggregations) > 0
-                        else None,
-                    }
-
-                conditions.append(condition_data)
-
-            result = {
-                "name": policy.name,
-                "display_name": policy.display_name,
-                "enabled": policy.enabled,
-                "conditions": conditions,
-                "combiner": monitoring_v3.AlertPolicy.ConditionCombinerType.Name(
-                    policy.combiner
-                )
-                if policy.combiner
-                else None,
-                "notification_channels": policy.notification_channels,
-                "creation_time": policy.creation_record.mutate_time.ToDatetime().isoformat()
-                if policy.creation_record and policy.creation_record.mutate_time
-                else None,
-                "documentation": {
-                    "content": policy.documentation.content,
-                    "mime_type": policy.documentation.mime_type,
-                }
-                if policy.HasField("documentation")
-                else None,
-            }
-
-            return json.dumps(result, indent=2)
+            result = _dumps(_to_dict(policy))
+            _ALERT_CACHE[key] = result
+            return result
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource("gcp://monitoring/{project_id}/notification_channels")
     def list_notification_channels_resource(project_id: str = None) -> str:
         """List notification channels for a GCP project"""
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_channels
             project_id = project_id or client_instances.get_project_id()
 
-            name = f"projects/{project_id}"
-            channels = client.list_notification_channels(name=name)
-
-            result = []
-            for channel in channels:
-                result.append(
-                    {
-                        "name": channel.name,
-                        "type": channel.type,
-                        "display_name": channel.display_name,
-                        "description": channel.description,
-                        "verification_status": monitoring_v3.NotificationChannel.VerificationStatus.Name(
-                            channel.verification_status
-                        )
-                        if channel.verification_status
-                        else None,
-                        "enabled": channel.enabled,
-                        "labels": dict(channel.labels) if channel.labels else {},
-                    }
+            result = _CHANNEL_CACHE.get(project_id)
+            if result is None:
+                name = f"projects/{project_id}"
+                request = monitoring_v3.ListNotificationChannelsRequest(
+                    name=name, page_size=_PAGE_SIZE
                 )
+                channels = client.list_notification_channels(request=request)
+
+                result = [_to_dict(channel) for channel in channels]
+                _CHANNEL_CACHE[project_id] = result
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     # Tools
     @mcp_instance.tool()
-    def list_metrics(project_id: str = None, filter_str: str = "") -> str:
+    def list_metrics(
+        project_id: str = None, filter_str: str = "", output_format: str = "json"
+    ) -> str:
         """
         List metrics in a GCP project with optional filtering
 
         Args:
             project_id: GCP project ID (defaults to configured project)
             filter_str: Optional filter string to narrow results (e.g., "metric.type = starts_with(\"compute.googleapis.com\")")
+            output_format: "json" (default) or "proto" for a base64-encoded ListMetricDescriptorsResponse
         """
         try:
             # Get client from client_instances
             client = client_instances.get_clients().monitoring
             project_id = project_id or client_instances.get_project_id()
 
-            parent = f"projects/{project_id}"
-            request = monitoring_v3.ListMetricDescriptorsRequest(
-                name=parent, filter=filter_str
-            )
-
-            print(f"Listing metrics for project {project_id}...")
-            metrics = client.list_metric_descriptors(request=request)
-
-            result = []
-            for metric in metrics:
-                result.append(
-                    {
-                        "name": metric.name,
-                        "type": metric.type,
-                        "display_name": metric.display_name,
-                        "description": metric.description,
-                        "kind": monitoring_v3.MetricDescriptor.MetricKind.Name(
-                            metric.metric_kind
-                        ),
-                        "value_type": monitoring_v3.MetricDescriptor.ValueType.Name(
-                            metric.value_type
-                        ),
-                        "unit": metric.unit,
-                    }
+            logger.debug("Listing metrics for project %s", project_id)
+            if output_format == "proto":
+                request = monitoring_v3.ListMetricDescriptorsRequest(
+                    name=f"projects/{project_id}",
+                    filter=filter_str,
+                    page_size=_PAGE_SIZE,
                 )
+                return _proto_result(
+                    monitoring_v3.ListMetricDescriptorsResponse(
+                        metric_descriptors=list(
+                            client.list_metric_descriptors(request=request)
+                        )
+                    )
+                )
+            result = _list_metric_rows(client, project_id, filter_str)
 
-            return json.dumps(
-                {"status": "success", "metrics": result, "count": len(result)}, indent=2
+            return _dumps(
+                {"status": "success", "metrics": result, "count": len(result)}
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
 
     @mcp_instance.tool()
     def fetch_metric_timeseries(
@@ -251,6 +390,7 @@ def register(mcp_instance):
         filter_additions: str = "",
         hours: int = 1,
         alignment_period_seconds: int = 60,
+        output_format: str = "json",
     ) -> str:
         """
         Fetch time series data for a specific metric
@@ -261,6 +401,7 @@ def register(mcp_instance):
             filter_additions: Additional filter criteria (e.g., "resource.labels.instance_id = \"my-instance\"")
             hours: Number of hours of data to fetch (default: 1)
             alignment_period_seconds: Data point alignment period in seconds (default: 60)
+            output_format: "json" (default) or "proto" for a base64-encoded ListTimeSeriesResponse
         """
         try:
             # Get client from client_instances
@@ -273,11 +414,12 @@ def register(mcp_instance):
                 filter_str += f" AND {filter_additions}"
 
             # Calculate time interval
-            now = datetime.datetime.utcnow()
-            seconds = int(now.timestamp())
-            end_time = Timestamp(seconds=seconds)
+            end_time = Timestamp()
+            end_time.GetCurrentTime()
 
-            start_time = Timestamp(seconds=seconds - hours * 3600)
+            start_time = Timestamp(
+                seconds=end_time.seconds - hours * 3600, nanos=end_time.nanos
+            )
 
             # Create interval
             interval = monitoring_v3.TimeInterval(
@@ -285,9 +427,8 @@ def register(mcp_instance):
             )
 
             # Create aggregation
-            aggregation = monitoring_v3.Aggregation(
-                alignment_period=Duration(seconds=alignment_period_seconds),
-                per_series_aligner=monitoring_v3.Aggregation.Aligner.ALIGN_MEAN,
+            aggregation = _aggregation(
+                alignment_period_seconds, monitoring_v3.Aggregation.Aligner.ALIGN_MEAN
             )
 
             # Build request
@@ -299,64 +440,54 @@ def register(mcp_instance):
                 aggregation=aggregation,
             )
 
-            print(f"Fetching time series data for {metric_type}...")
+            logger.debug("Fetching time series data for %s", metric_type)
             time_series = client.list_time_series(request=request)
+            if output_format == "proto":
+                return _proto_result(
+                    monitoring_v3.ListTimeSeriesResponse(time_series=list(time_series))
+                )
 
             result = []
             for series in time_series:
+                # Work on the raw protobuf so oneofs and label maps are read
+                # directly instead of through proto-plus wrappers
+                series = monitoring_v3.TimeSeries.pb(series)
                 data_points = []
                 for point in series.points:
-                    point_time = point.interval.end_time.ToDatetime().isoformat()
-
-                    # Handle different value types
-                    if point.value.HasField("double_value"):
-                        value = point.value.double_value
-                    elif point.value.HasField("int64_value"):
-                        value = point.value.int64_value
-                    elif point.value.HasField("bool_value"):
-                        value = point.value.bool_value
-                    elif point.value.HasField("string_value"):
-                        value = point.value.string_value
-                    elif point.value.HasField("distribution_value"):
-                        value = (
-                            "distribution"  # Simplified, as distributions are complex
-                        )
-                    else:
-                        value = None
+                    point_time = point.interval.end_time.ToDatetime()
+
+                    # Handle different value types with a single oneof lookup
+                    getter = _VALUE_GETTERS.get(point.value.WhichOneof("value"))
+                    value = getter(point.value) if getter else None
 
                     data_points.append({"time": point_time, "value": value})
 
                 series_data = {
-                    "metric": dict(series.metric.labels)
-                    if series.metric and series.metric.labels
-                    else {},
+                    "metric": _labels(series.metric),
                     "resource": {
                         "type": series.resource.type,
-                        "labels": dict(series.resource.labels)
-                        if series.resource and series.resource.labels
-                        else {},
+                        "labels": _labels(series.resource),
                     }
-                    if series.resource
+                    if series.HasField("resource")
                     else {},
                     "points": data_points,
                 }
                 result.append(series_data)
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "metric_type": metric_type,
                     "time_range": {
-                        "start": start_time.ToDatetime().isoformat(),
-                        "end": end_time.ToDatetime().isoformat(),
+                        "start": start_time.ToDatetime(),
+                        "end": end_time.ToDatetime(),
                     },
                     "time_series": result,
                     "count": len(result),
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
 
     @mcp_instance.tool()
     def list_alert_policies(project_id: str = None, filter_str: str = "") -> str:
@@ -369,46 +500,43 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_alerts
             project_id = project_id or client_instances.get_project_id()
 
-            parent = f"projects/{project_id}"
-            request = monitoring_v3.ListAlertPoliciesRequest(
-                name=parent, filter=filter_str
-            )
-
-            print(f"Listing alert policies for project {project_id}...")
-            policies = client.list_alert_policies(request=request)
+            key = (project_id, filter_str)
+            result = _ALERT_POLICY_CACHE.get(key)
+            if result is None:
+                parent = f"projects/{project_id}"
+                request = monitoring_v3.ListAlertPoliciesRequest(
+                    name=parent, filter=filter_str, page_size=_PAGE_SIZE
+                )
 
-            result = []
-            for policy in policies:
-                policy_data = {
-                    "name": policy.name,
-                    "display_name": policy.display_name,
-                    "enabled": policy.enabled,
-                    "conditions_count": len(policy.conditions),
-                    "combiner": monitoring_v3.AlertPolicy.ConditionCombinerType.Name(
-                        policy.combiner
+                logger.debug("Listing alert policies for project %s", project_id)
+                policies = client.list_alert_policies(request=request)
+
+                result = []
+                for policy in policies:
+                    result.append(
+                        _AlertPolicyRow(
+                            policy.name,
+                            policy.display_name,
+                            policy.enabled,
+                            len(policy.conditions),
+                            _enum_name(_COMBINER, policy.combiner),
+                            [
+                                chan.split("/")[-1]
+                                for chan in policy.notification_channels
+                            ],
+                            policy.creation_record.mutate_time,
+                        )
                     )
-                    if policy.combiner
-                    else None,
-                    "notification_channels": [
-                        chan.split("/")[-1] for chan in policy.notification_channels
-                    ]
-                    if policy.notification_channels
-                    else [],
-                    "creation_time": policy.creation_record.mutate_time.ToDatetime().isoformat()
-                    if policy.creation_record and policy.creation_record.mutate_time
-                    else None,
-                }
-                result.append(policy_data)
+                _ALERT_POLICY_CACHE[key] = result
 
-            return json.dumps(
+            return _dumps(
                 {"status": "success", "alert_policies": result, "count": len(result)},
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
 
     @mcp_instance.tool()
     def create_metric_threshold_alert(
@@ -446,21 +574,28 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_alerts
             project_id = project_id or client_instances.get_project_id()
 
             # Validate and convert enums
-            try:
-                comparison_enum = getattr(monitoring_v3.ComparisonType, comparison)
-                aligner_enum = getattr(monitoring_v3.Aggregation.Aligner, aligner)
-                reducer_enum = getattr(monitoring_v3.Aggregation.Reducer, reducer)
-            except AttributeError as e:
-                return json.dumps(
+            comparison_enum = _COMPARISON_BY_NAME.get(comparison)
+            aligner_enum = _ALIGNER_BY_NAME.get(aligner)
+            reducer_enum = _REDUCER_BY_NAME.get(reducer)
+            if None in (comparison_enum, aligner_enum, reducer_enum):
+                invalid = [
+                    name
+                    for name, member in (
+                        (comparison, comparison_enum),
+                        (aligner, aligner_enum),
+                        (reducer, reducer_enum),
+                    )
+                    if member is None
+                ]
+                return _dumps(
                     {
                         "status": "error",
-                        "message": f"Invalid enum value: {str(e)}. Please check documentation for valid values.",
+                        "message": f"Invalid enum value: {', '.join(invalid)}. Please check documentation for valid values.",
                     },
-                    indent=2,
                 )
 
             # Prepare notification channels with full paths
@@ -476,11 +611,8 @@ def register(mcp_instance):
                     full_notification_channels.append(channel)
 
             # Create aggregation
-            aggregation = monitoring_v3.Aggregation(
-                alignment_period=Duration(seconds=alignment_period_seconds),
-                per_series_aligner=aligner_enum,
-                cross_series_reducer=reducer_enum,
-                group_by_fields=[],
+            aggregation = _aggregation(
+                alignment_period_seconds, aligner_enum, reducer_enum
             )
 
             # Create condition threshold
@@ -504,7 +636,7 @@ def register(mcp_instance):
                 conditions=[condition],
                 combiner=monitoring_v3.AlertPolicy.ConditionCombinerType.OR,
                 notification_channels=full_notification_channels,
-                enabled=monitoring_v3.BoolValue(value=enabled),
+                enabled=enabled,
             )
 
             # Add documentation if provided
@@ -518,10 +650,11 @@ def register(mcp_instance):
                 name=f"projects/{project_id}", alert_policy=alert_policy
             )
 
-            print(f"Creating alert policy: {display_name}...")
+            logger.debug("Creating alert policy: %s", display_name)
             response = client.create_alert_policy(request=request)
+            _invalidate_alerts(project_id)
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "name": response.name,
@@ -530,10 +663,9 @@ def register(mcp_instance):
                     "conditions_count": len(response.conditions),
                     "notification_channels": response.notification_channels,
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
 
     @mcp_instance.tool()
     def update_alert_policy(
@@ -557,7 +689,7 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_alerts
             project_id = project_id or client_instances.get_project_id()
 
             # Get the existing policy
@@ -581,7 +713,7 @@ def register(mcp_instance):
                 policy.notification_channels = full_notification_channels
 
             if enabled is not None:
-                policy.enabled = monitoring_v3.BoolValue(value=enabled)
+                policy.enabled = enabled
 
             if documentation is not None:
                 policy.documentation = monitoring_v3.AlertPolicy.Documentation(
@@ -604,10 +736,11 @@ def register(mcp_instance):
                 alert_policy=policy, update_mask={"paths": update_mask}
             )
 
-            print(f"Updating alert policy: {policy.name}...")
+            logger.debug("Updating alert policy: %s", policy.name)
             response = client.update_alert_policy(request=request)
+            _invalidate_alerts(project_id, alert_id)
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "name": response.name,
@@ -620,10 +753,9 @@ def register(mcp_instance):
                     if response.notification_channels
                     else [],
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
 
     @mcp_instance.tool()
     def delete_alert_policy(alert_id: str, project_id: str = None) -> str:
@@ -636,23 +768,72 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_alerts
             project_id = project_id or client_instances.get_project_id()
 
             name = f"projects/{project_id}/alertPolicies/{alert_id}"
 
-            print(f"Deleting alert policy: {alert_id}...")
+            logger.debug("Deleting alert policy: %s", alert_id)
             client.delete_alert_policy(name=name)
+            _invalidate_alerts(project_id, alert_id)
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "message": f"Alert policy {alert_id} successfully deleted",
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
+
+    @mcp_instance.tool()
+    async def delete_alert_policies(
+        alert_ids: List[str], project_id: str = None, concurrency: int = 16
+    ) -> str:
+        """
+        Delete several alert policies concurrently
+
+        Args:
+            alert_ids: IDs of the alerts to delete
+            project_id: GCP project ID (defaults to configured project)
+            concurrency: Maximum number of delete requests in flight at once
+        """
+        try:
+            # Get client from client_instances
+            client = client_instances.get_clients().monitoring_alerts_async
+            project_id = project_id or client_instances.get_project_id()
+
+            sem = asyncio.Semaphore(max(1, concurrency))
+
+            async def _delete(alert_id: str) -> None:
+                async with sem:
+                    await client.delete_alert_policy(
+                        name=f"projects/{project_id}/alertPolicies/{alert_id}"
+                    )
+
+            logger.debug("Deleting %d alert policies", len(alert_ids))
+            results = await asyncio.gather(
+                *(_delete(alert_id) for alert_id in alert_ids), return_exceptions=True
+            )
+            _invalidate_alerts(project_id, *alert_ids)
+
+            deleted = []
+            failed = []
+            for alert_id, outcome in zip(alert_ids, results):
+                if isinstance(outcome, Exception):
+                    failed.append({"alert_id": alert_id, "message": str(outcome)})
+                else:
+                    deleted.append(alert_id)
+
+            return _dumps(
+                {
+                    "status": "error" if failed and not deleted else "success",
+                    "deleted": deleted,
+                    "failed": failed,
+                },
+            )
+        except Exception as e:
+            return _error(e)
 
     @mcp_instance.tool()
     def create_notification_channel(
@@ -676,7 +857,7 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().monitoring
+            client = client_instances.get_clients().monitoring_channels
             project_id = project_id or client_instances.get_project_id()
 
             # Create notification channel
@@ -685,7 +866,7 @@ def register(mcp_instance):
                 display_name=display_name,
                 description=description,
                 labels=labels,
-                enabled=monitoring_v3.BoolValue(value=enabled),
+                enabled=enabled,
             )
 
             # Create the request
@@ -693,62 +874,41 @@ def register(mcp_instance):
                 name=f"projects/{project_id}", notification_channel=notification_channel
             )
 
-            print(f"Creating notification channel: {display_name} ({channel_type})...")
+            logger.debug(
+                "Creating notification channel: %s (%s)", display_name, channel_type
+            )
             response = client.create_notification_channel(request=request)
+            _CHANNEL_CACHE.pop(project_id, None)
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "name": response.name,
                     "type": response.type,
                     "display_name": response.display_name,
                     "description": response.description,
-                    "verification_status": monitoring_v3.NotificationChannel.VerificationStatus.Name(
-                        response.verification_status
-                    )
-                    if response.verification_status
-                    else None,
+                    "verification_status": _enum_name(
+                        _VERIFICATION, response.verification_status
+                    ),
                     "enabled": response.enabled,
-                    "labels": dict(response.labels) if response.labels else {},
+                    "labels": _labels(response),
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _error(e)
 
     # Prompts
-    @mcp_instance.prompt()
-    def create_alert_prompt() -> str:
-        """Prompt for creating a new alert policy"""
-        return """
-I need to create a new alert policy in Cloud Monitoring.
-
-Please help me with:
-1. Selecting the appropriate metric type for my alert
-2. Setting up sensible thresholds and durations
-3. Understanding the different comparison types
-4. Best practices for alert documentation
-5. Setting up notification channels
-
-I'd like to create an alert that triggers when:
-"""
-
-    @mcp_instance.prompt()
-    def monitor_resources_prompt() -> str:
-        """Prompt for guidance on monitoring GCP resources"""
-        return """
-I need to set up monitoring for my GCP resources. Please help me understand:
-
-1. What are the most important metrics I should be monitoring for:
-   - Compute Engine instances
-   - Cloud SQL databases
-   - Cloud Storage buckets
-   - App Engine applications
-   - Kubernetes Engine clusters
-
-2. What are recommended thresholds for alerts on these resources?
-
-3. How should I organize my monitoring to keep it manageable?
-
-4. What visualization options do I have in Cloud Monitoring?
-"""
+    mcp_instance.add_prompt(
+        _static_prompt(
+            "create_alert_prompt",
+            "Prompt for creating a new alert policy",
+            _CREATE_ALERT_PROMPT,
+        )
+    )
+    mcp_instance.add_prompt(
+        _static_prompt(
+            "monitor_resources_prompt",
+            "Prompt for guidance on monitoring GCP resources",
+            _MONITOR_RESOURCES_PROMPT,
+        )
+    )
@@ -1,245 +1,318 @@
-import json
-from typing import Dict, Optional
-
+import asyncio
+import logging
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
 from google.cloud import run_v2
 from google.protobuf import field_mask_pb2
 from services import client_instances
 
+logger = logging.getLogger(__name__)
+
+# Deployment state is polled in bursts; serve repeated reads for a few seconds
+_SERVICE_CACHE = TTLCache(maxsize=256, ttl=10)
+_SERVICE_LIST_CACHE = TTLCache(maxsize=64, ttl=10)
+
+# Fields returned by service listings: enough to describe each service and its
+# serving state without a follow-up get_service. next_page_token must stay in
+# the mask or paging stops after the first page.
+_LIST_SERVICES_METADATA = (
+    (
+        "x-goog-fieldmask",
+        "services.name,services.uid,services.generation,services.labels,"
+        "services.annotations,services.create_time,services.update_time,"
+        "services.uri,services.template.containers.image,services.traffic,"
+        "next_page_token",
+    ),
+)
+
+
+# Prompt bodies; the parameterized ones are filled with str.format
+_DEPLOY_SERVICE_PROMPT = """
+I need to deploy a Cloud Run service with the following configuration:
+
+- Service name: {service_name}
+- Container image: {image}
+- Min instances: {min_instances}
+- Max instances: {max_instances}
+- Environment variables: {env_vars}
+
+Please help me set up this service and explain the deployment process and any best practices I should follow.
+"""
+
+_CHECK_SERVICE_STATUS_PROMPT = """
+I need to check the current status of my Cloud Run service named "{service_name}".
+
+Please provide me with:
+1. Is the service currently running?
+2. What is the URL to access it?
+3. What revision is currently serving traffic?
+4. Are there any issues with the service?
+"""
+
+_CREATE_SERVICE_PROMPT = """
+I need to create a new Cloud Run service in {region}.
+
+Please help me with:
+1. What container image should I use?
+2. How much CPU and memory should I allocate?
+3. Should I set min and max instances for scaling?
+4. Do I need to set any environment variables?
+5. Should I allow unauthenticated access?
+6. What's the best way to deploy my service?
+"""
+
+_UPDATE_SERVICE_PROMPT = """
+I need to update my Cloud Run service.
+
+Please help me understand:
+1. How to update the container image
+2. How to change resource allocations
+3. How to add or modify environment variables
+4. How to update scaling settings
+5. Best practices for zero-downtime updates
+"""
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool/resource result as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _to_dict(message: Any) -> Dict[str, Any]:
+    """Convert a Cloud Run message to a dict, omitting unset fields.
+
+    Resource names that the handlers used to shorten (the message name, a
+    revision's service and traffic target revisions) are reduced to their
+    last path segment.
+    """
+    result = type(message).to_dict(
+        message,
+        use_integers_for_enums=False,
+        always_print_fields_with_no_presence=False,
+    )
+    for key in ("name", "service"):
+        if key in result:
+            result[key] = result[key].rpartition("/")[2]
+    for traffic in result.get("traffic", ()):
+        if "revision" in traffic:
+            traffic["revision"] = traffic["revision"].rpartition("/")[2]
+    return result
+
+
+# Condition state -> name for operation status reports; other enums go
+# through to_dict
+_CONDITION_STATE_NAMES = {state: state.name for state in run_v2.Condition.State}
+
+
+# Fields returned by single-service reads; drops status bookkeeping such as
+# conditions and traffic_statuses that the handlers do not report
+_GET_SERVICE_FIELDS = (
+    "name",
+    "uid",
+    "generation",
+    "labels",
+    "annotations",
+    "create_time",
+    "update_time",
+    "creator",
+    "last_modifier",
+    "client",
+    "client_version",
+    "ingress",
+    "launch_stage",
+    "traffic",
+    "uri",
+    "template",
+)
+_GET_SERVICE_METADATA = (("x-goog-fieldmask", ",".join(_GET_SERVICE_FIELDS)),)
+
+
+def _set_env(service: Any, env_vars: Dict[str, str]) -> None:
+    service.template.containers[0].env = [
+        run_v2.EnvVar(name=key, value=value) for key, value in env_vars.items()
+    ]
+
+
+# update_service argument -> (setter applied to the fetched Service, field mask
+# path it modifies); applied in this order, one pass over the set arguments
+_UPDATERS = (
+    (
+        "image",
+        lambda svc, v: setattr(svc.template.containers[0], "image", v),
+        "template.containers[0].image",
+    ),
+    (
+        "memory",
+        lambda svc, v: svc.template.containers[0].resources.limits.update(memory=v),
+        "template.containers[0].resources.limits.memory",
+    ),
+    (
+        "cpu",
+        lambda svc, v: svc.template.containers[0].resources.limits.update(cpu=v),
+        "template.containers[0].resources.limits.cpu",
+    ),
+    (
+        "max_instances",
+        lambda svc, v: setattr(svc.template.scaling, "max_instance_count", v),
+        "template.scaling.max_instance_count",
+    ),
+    (
+        "min_instances",
+        lambda svc, v: setattr(svc.template.scaling, "min_instance_count", v),
+        "template.scaling.min_instance_count",
+    ),
+    (
+        "concurrency",
+        lambda svc, v: setattr(svc.template, "max_instance_request_concurrency", v),
+        "template.max_instance_request_concurrency",
+    ),
+    (
+        "timeout_seconds",
+        lambda svc, v: setattr(svc.template, "timeout", {"seconds": v}),
+        "template.timeout",
+    ),
+    (
+        "service_account",
+        lambda svc, v: setattr(svc.template, "service_account", v),
+        "template.service_account",
+    ),
+    ("env_vars", _set_env, "template.containers[0].env"),
+    ("labels", lambda svc, v: setattr(svc, "labels", v), "labels"),
+)
+_UPDATE_PATHS = {field: sys.intern(path) for field, _, path in _UPDATERS}
+
+# Arguments whose updaters write into the first container; skipped for a
+# template without containers
+_CONTAINER_FIELDS = frozenset(
+    field for field, _, path in _UPDATERS if path.startswith("template.containers[0].")
+)
+
+
+@lru_cache(maxsize=64)
+def _update_mask(fields: Tuple[str, ...]) -> field_mask_pb2.FieldMask:
+    """Build (once per combination) the update mask for the given arguments."""
+    return field_mask_pb2.FieldMask(paths=[_UPDATE_PATHS[field] for field in fields])
+
+
+async def _get_service(client, project_id: str, location: str, service_name: str):
+    """Fetch a Service, served from _SERVICE_CACHE while fresh."""
+    key = (project_id, location, service_name)
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        name = run_v2.ServicesClient.service_path(project_id, location, service_name)
+        service = await client.get_service(name=name, metadata=_GET_SERVICE_METADATA)
+        _SERVICE_CACHE[key] = service
+    return service
+
+
+async def _list_services(client, project_id: str, location: str) -> List[Any]:
+    """List Services in a location, served from _SERVICE_LIST_CACHE while fresh."""
+    key = (project_id, location)
+    services = _SERVICE_LIST_CACHE.get(key)
+    if services is None:
+        parent = run_v2.ServicesClient.common_location_path(project_id, location)
+        pager = await client.list_services(
+            parent=parent, metadata=_LIST_SERVICES_METADATA
+        )
+        services = [service async for service in pager]
+        _SERVICE_LIST_CACHE[key] = services
+    return services
+
+
+async def _list_revisions(
+    client, project_id: str, location: str, service_name: str
+) -> List[Any]:
+    """List a service's revisions."""
+    parent = run_v2.ServicesClient.service_path(project_id, location, service_name)
+    request = run_v2.ListRevisionsRequest(parent=parent, page_size=100)
+    pager = await client.list_revisions(request=request)
+    return [revision async for revision in pager]
+
+
+def _invalidate_service(project_id: str, location: str, service_name: str) -> None:
+    """Drop cached reads for a service after it is created, updated or deleted."""
+    _SERVICE_CACHE.pop((project_id, location, service_name), None)
+    _SERVICE_LIST_CACHE.pop((project_id, location), None)
+
+
+def _pending(operation: Any, **fields: Any) -> Dict[str, Any]:
+    """Describe a started long-running operation for the caller to poll."""
+    return {
+        "status": "pending",
+        "operation": operation.operation.name,
+        "poll_with": "get_operation_status",
+        **fields,
+    }
+
 
 def register(mcp_instance):
     """Register all Cloud Run resources and tools with the MCP instance."""
 
     # Resources
     @mcp_instance.resource("gcp://cloudrun/{project_id}/{region}/services")
-    def list_services_resource(project_id: str = None, region: str = None) -> str:
+    async def list_services_resource(project_id: str = None, region: str = None) -> str:
         """List all Cloud Run services in a specific region"""
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             region = region or client_instances.get_location()
 
-            parent = f"projects/{project_id}/locations/{region}"
-            services = client.list_services(parent=parent)
-
-            result = []
-            for service in services:
-                result.append(
-                    {
-                        "name": service.name.split("/")[-1],
-                        "uid": service.uid,
-                        "generation": service.generation,
-                        "labels": dict(service.labels) if service.labels else {},
-                        "annotations": dict(service.annotations)
-                        if service.annotations
-                        else {},
-                        "create_time": service.create_time.isoformat()
-                        if service.create_time
-                        else None,
-                        "update_time": service.update_time.isoformat()
-                        if service.update_time
-                        else None,
-                        "uri": service.uri,
-                    }
-                )
+            services = await _list_services(client, project_id, region)
 
-            return json.dumps(result, indent=2)
+            return _dumps([_to_dict(service) for service in services])
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource("gcp://run/{project_id}/{location}/service/{service_name}")
-    def get_service_resource(
+    async def get_service_resource(
         service_name: str, project_id: str = None, location: str = None
     ) -> str:
         """Get details for a specific Cloud Run service"""
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             location = location or client_instances.get_location()
 
-            name = f"projects/{project_id}/locations/{location}/services/{service_name}"
-            service = client.get_service(name=name)
-
-            # Extract container details
-            containers = []
-            if service.template and service.template.containers:
-                for container in service.template.containers:
-                    container_info = {
-                        "image": container.image,
-                        "command": list(container.command) if container.command else [],
-                        "args": list(container.args) if container.args else [],
-                        "env": [
-                            {"name": env.name, "value": env.value}
-                            for env in container.env
-                        ]
-                        if container.env
-                        else [],
-                        "resources": {
-                            "limits": dict(container.resources.limits)
-                            if container.resources and container.resources.limits
-                            else {},
-                            "cpu_idle": container.resources.cpu_idle
-                            if container.resources
-                            else None,
-                        }
-                        if container.resources
-                        else {},
-                        "ports": [
-                            {"name": port.name, "container_port": port.container_port}
-                            for port in container.ports
-                        ]
-                        if container.ports
-                        else [],
-                    }
-                    containers.append(container_info)
-
-            # Extract scaling details
-            scaling = None
-            if service.template and service.template.scaling:
-                scaling = {
-                    "min_instance_count": service.template.scaling.min_instance_count,
-                    "max_instance_count": service.template.scaling.max_instance_count,
-                }
+            service = await _get_service(client, project_id, location, service_name)
 
-            result = {
-                "name": service.name.split("/")[-1],
-                "uid": service.uid,
-                "generation": service.generation,
-                "labels": dict(service.labels) if service.labels else {},
-                "annotations": dict(service.annotations) if service.annotations else {},
-                "create_time": service.create_time.isoformat()
-                if service.create_time
-                else None,
-                "update_time": service.update_time.isoformat()
-                if service.update_time
-                else None,
-                "creator": service.creator,
-                "last_modifier": service.last_modifier,
-                "client": service.client,
-                "client_version": service.client_version,
-                "ingress": service.ingress.name if service.ingress else None,
-                "launch_stage": service.launch_stage.name
-                if service.launch_stage
-                else None,
-                "traffic": [
-                    {
-                        "type": traffic.type_.name if traffic.type_ else None,
-                        "revision": traffic.revision.split("/")[-1]
-                        if traffic.revision
-                        else None,
-                        "percent": traffic.percent,
-                        "tag": traffic.tag,
-                    }
-                    for traffic in service.traffic
-                ]
-                if service.traffic
-                else [],
-                "uri": service.uri,
-                "template": {
-                    "containers": containers,
-                    "execution_environment": service.template.execution_environment.name
-                    if service.template and service.template.execution_environment
-                    else None,
-                    "vpc_access": {
-                        "connector": service.template.vpc_access.connector,
-                        "egress": service.template.vpc_access.egress.name
-                        if service.template.vpc_access.egress
-                        else None,
-                    }
-                    if service.template and service.template.vpc_access
-                    else None,
-                    "scaling": scaling,
-                    "timeout": f"{service.template.timeout.seconds}s {service.template.timeout.nanos}ns"
-                    if service.template and service.template.timeout
-                    else None,
-                    "service_account": service.template.service_account
-                    if service.template
-                    else None,
-                }
-                if service.template
-                else {},
-            }
+            result = _to_dict(service)
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource(
         "gcp://run/{project_id}/{location}/service/{service_name}/revisions"
     )
-    def list_revisions_resource(
+    async def list_revisions_resource(
         service_name: str, project_id: str = None, location: str = None
     ) -> str:
         """List revisions for a specific Cloud Run service"""
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_revisions_async
             project_id = project_id or client_instances.get_project_id()
             location = location or client_instances.get_location()
 
-            parent = f"projects/{project_id}/locations/{location}"
-
-            # List all revisions
-            revisions = client.list_revisions(parent=parent)
+            revisions = await _list_revisions(
+                client, project_id, location, service_name
+            )
 
-            # Filter revisions for the specified service
-            service_revisions = []
-            for revision in revisions:
-                # Check if this revision belongs to the specified service
-                if service_name in revision.name:
-                    service_revisions.append(
-                        {
-                            "name": revision.name.split("/")[-1],
-                            "uid": revision.uid,
-                            "generation": revision.generation,
-                            "service": revision.service.split("/")[-1]
-                            if revision.service
-                            else None,
-                            "create_time": revision.create_time.isoformat()
-                            if revision.create_time
-                            else None,
-                            "update_time": revision.update_time.isoformat()
-                            if revision.update_time
-                            else None,
-                            "scaling": {
-                                "min_instance_count": revision.scaling.min_instance_count
-                                if revision.scaling
-                                else None,
-                                "max_instance_count": revision.scaling.max_instance_count
-                                if revision.scaling
-                                else None,
-                            }
-                            if revision.scaling
-                            else None,
-                            "conditions": [
-                                {
-                                    "type": condition.type,
-                                    "state": condition.state.name
-                                    if condition.state
-                                    else None,
-                                    "message": condition.message,
-                                    "last_transition_time": condition.last_transition_time.isoformat()
-                                    if condition.last_transition_time
-                                    else None,
-                                    "severity": condition.severity.name
-                                    if condition.severity
-                                    else None,
-                                }
-                                for condition in revision.conditions
-                            ]
-                            if revision.conditions
-                            else [],
-                        }
-                    )
+            service_revisions = [_to_dict(revision) for revision in revisions]
 
-            return json.dumps(service_revisions, indent=2)
+            return _dumps(service_revisions)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     # Tools
     @mcp_instance.tool()
-    def create_service(
+    async def create_service(
         service_name: str,
         image: str,
         project_id: str = None,
@@ -258,6 +331,8 @@ def register(mcp_instance):
         """
         Create a new Cloud Run service
 
+        Returns once the operation starts; poll get_operation_status for the outcome.
+
         Args:
             service_name: Name for the new service
             image: Container image to deploy (e.g., gcr.io/project/image:tag)
@@ -276,11 +351,13 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             location = location or client_instances.get_location()
 
-            print(f"Creating Cloud Run service {service_name} in {location}...")
+            logger.debug(
+                "Creating Cloud Run service %s in %s...", service_name, location
+            )
 
             # Create container
             container = run_v2.Container(
@@ -333,79 +410,52 @@ def register(mcp_instance):
             )
 
             # Create the service
-            parent = f"projects/{project_id}/locations/{location}"
-            operation = client.create_service(
+            parent = run_v2.ServicesClient.common_location_path(project_id, location)
+            operation = await client.create_service(
                 parent=parent,
                 service_id=service_name,
                 service=service,
             )
 
-            # Wait for the operation to complete
-            print(f"Waiting for service {service_name} to be created...")
-            result = operation.result()
+            _invalidate_service(project_id, location, service_name)
 
-            return json.dumps(
-                {
-                    "status": "success",
-                    "name": result.name.split("/")[-1],
-                    "uri": result.uri,
-                    "create_time": result.create_time.isoformat()
-                    if result.create_time
-                    else None,
-                    "update_time": result.update_time.isoformat()
-                    if result.update_time
-                    else None,
-                },
-                indent=2,
-            )
+            return _dumps(_pending(operation, name=service_name))
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
-    def list_services(project_id: str = None, region: str = None) -> str:
+    async def list_services(project_id: str = None, region: str = None) -> str:
         """
         List Cloud Run services in a specific region
 
+        Each entry includes the service's URI, labels, container images and
+        traffic split, so get_service is only needed for full template details.
+
         Args:
             project_id: GCP project ID (defaults to configured project)
             region: GCP region (e.g., us-central1) (defaults to configured location)
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             region = region or client_instances.get_location()
 
-            parent = f"projects/{project_id}/locations/{region}"
-
-            print(f"Listing Cloud Run services in {region}...")
-            services = client.list_services(parent=parent)
-
-            result = []
-            for service in services:
-                result.append(
-                    {
-                        "name": service.name.split("/")[-1],
-                        "uri": service.uri,
-                        "create_time": service.create_time.isoformat()
-                        if service.create_time
-                        else None,
-                        "update_time": service.update_time.isoformat()
-                        if service.update_time
-                        else None,
-                        "labels": dict(service.labels) if service.labels else {},
-                    }
-                )
+            logger.debug("Listing Cloud Run services in %s...", region)
+            services = await _list_services(client, project_id, region)
 
-            return json.dumps(
-                {"status": "success", "services": result, "count": len(result)},
-                indent=2,
+            return _dumps(
+                {
+                    "status": "success",
+                    "services": [_to_dict(service) for service in services],
+                    "count": len(services),
+                }
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
-    def update_service(
+    async def update_service(
         service_name: str,
         project_id: str = None,
         region: str = None,
@@ -423,6 +473,8 @@ def register(mcp_instance):
         """
         Update an existing Cloud Run service
 
+        Returns once the operation starts; poll get_operation_status for the outcome.
+
         Args:
             service_name: Name of the service to update
             project_id: GCP project ID (defaults to configured project)
@@ -440,140 +492,78 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             region = region or client_instances.get_location()
 
             # Get the existing service
-            name = f"projects/{project_id}/locations/{region}/services/{service_name}"
-
-            print(f"Getting current service configuration for {service_name}...")
-            service = client.get_service(name=name)
-
-            # Track which fields are being updated
-            update_mask_fields = []
-
-            # Update the container image if specified
-            if image and service.template and service.template.containers:
-                service.template.containers[0].image = image
-                update_mask_fields.append("template.containers[0].image")
-
-            # Update resources if specified
-            if (memory or cpu) and service.template and service.template.containers:
-                if not service.template.containers[0].resources:
-                    service.template.containers[
-                        0
-                    ].resources = run_v2.ResourceRequirements(limits={})
-
-                if not service.template.containers[0].resources.limits:
-                    service.template.containers[0].resources.limits = {}
-
-                if memory:
-                    service.template.containers[0].resources.limits["memory"] = memory
-                    update_mask_fields.append(
-                        "template.containers[0].resources.limits.memory"
-                    )
-
-                if cpu:
-                    service.template.containers[0].resources.limits["cpu"] = cpu
-                    update_mask_fields.append(
-                        "template.containers[0].resources.limits.cpu"
-                    )
-
-            # Update scaling parameters
-            if max_instances is not None and service.template:
-                service.template.max_instance_count = max_instances
-                update_mask_fields.append("template.max_instance_count")
-
-            if min_instances is not None and service.template:
-                service.template.min_instance_count = min_instances
-                update_mask_fields.append("template.min_instance_count")
-
-            # Update concurrency
-            if concurrency is not None and service.template:
-                service.template.max_instance_request_concurrency = concurrency
-                update_mask_fields.append("template.max_instance_request_concurrency")
-
-            # Update timeout
-            if timeout_seconds is not None and service.template:
-                service.template.timeout = {"seconds": timeout_seconds}
-                update_mask_fields.append("template.timeout")
-
-            # Update service account
-            if service_account is not None and service.template:
-                service.template.service_account = service_account
-                update_mask_fields.append("template.service_account")
-
-            # Update environment variables
-            if (
-                env_vars is not None
-                and service.template
-                and service.template.containers
-            ):
-                # Create new env var list
-                new_env_vars = [
-                    run_v2.EnvVar(name=key, value=value)
-                    for key, value in env_vars.items()
-                ]
-                service.template.containers[0].env = new_env_vars
-                update_mask_fields.append("template.containers[0].env")
+            name = run_v2.ServicesClient.service_path(project_id, region, service_name)
+
+            logger.debug(
+                "Getting current service configuration for %s...", service_name
+            )
+            service = await client.get_service(name=name)
+
+            values = {
+                "image": image,
+                "memory": memory,
+                "cpu": cpu,
+                "max_instances": max_instances,
+                "min_instances": min_instances,
+                "concurrency": concurrency,
+                "timeout_seconds": timeout_seconds,
+                "service_account": service_account,
+                "env_vars": env_vars,
+                "labels": labels,
+            }
 
-            # Update labels
-            if labels is not None:
-                service.labels = labels
-                update_mask_fields.append("labels")
+            # Apply each specified argument, tracking which were set
+            has_containers = bool(service.template and service.template.containers)
+            updated = []
+            for field, apply, _ in _UPDATERS:
+                value = values[field]
+                if value is not None:
+                    if field in _CONTAINER_FIELDS and not has_containers:
+                        continue
+                    apply(service, value)
+                    updated.append(field)
 
             # Only proceed if there are fields to update
-            if not update_mask_fields:
-                return json.dumps(
-                    {"status": "info", "message": "No updates specified"}, indent=2
-                )
+            if not updated:
+                return _dumps({"status": "info", "message": "No updates specified"})
 
             # Create update mask
-            update_mask = field_mask_pb2.FieldMask(paths=update_mask_fields)
+            update_mask = _update_mask(tuple(updated))
 
             # Create the request
             request = run_v2.UpdateServiceRequest(
                 service=service, update_mask=update_mask
             )
 
-            print(f"Updating Cloud Run service {service_name}...")
-            operation = client.update_service(request=request)
+            logger.debug("Updating Cloud Run service %s...", service_name)
+            operation = await client.update_service(request=request)
 
-            print("Waiting for service update to complete...")
-            response = operation.result()
+            _invalidate_service(project_id, region, service_name)
 
-            return json.dumps(
-                {
-                    "status": "success",
-                    "name": response.name,
-                    "uri": response.uri,
-                    "updated_fields": update_mask_fields,
-                    "conditions": [
-                        {
-                            "type": condition.type_,
-                            "state": condition.state.name
-                            if hasattr(condition.state, "name")
-                            else str(condition.state),
-                            "message": condition.message,
-                        }
-                        for condition in response.conditions
-                    ]
-                    if response.conditions
-                    else [],
-                },
-                indent=2,
+            return _dumps(
+                _pending(
+                    operation,
+                    name=service_name,
+                    updated_fields=list(update_mask.paths),
+                )
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
-    def delete_service(
+    async def delete_service(
         service_name: str, project_id: str = None, region: str = None
     ) -> str:
         """
         Delete a Cloud Run service
 
+        Returns once the operation starts; poll get_operation_status for the outcome.
+
         Args:
             service_name: Name of the service to delete
             project_id: GCP project ID (defaults to configured project)
@@ -581,30 +571,23 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             region = region or client_instances.get_location()
 
-            name = f"projects/{project_id}/locations/{region}/services/{service_name}"
+            name = run_v2.ServicesClient.service_path(project_id, region, service_name)
 
-            print(f"Deleting Cloud Run service {service_name} in {region}...")
-            operation = client.delete_service(name=name)
+            logger.debug("Deleting Cloud Run service %s in %s...", service_name, region)
+            operation = await client.delete_service(name=name)
 
-            print("Waiting for service deletion to complete...")
-            operation.result()
+            _invalidate_service(project_id, region, service_name)
 
-            return json.dumps(
-                {
-                    "status": "success",
-                    "message": f"Service {service_name} successfully deleted",
-                },
-                indent=2,
-            )
+            return _dumps(_pending(operation, name=service_name))
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
-    def get_service(
+    async def get_service(
         service_name: str, project_id: str = None, region: str = None
     ) -> str:
         """
@@ -617,65 +600,117 @@ def register(mcp_instance):
         """
         try:
             # Get client from client_instances
-            client = client_instances.get_clients().run
+            client = client_instances.get_clients().run_async
             project_id = project_id or client_instances.get_project_id()
             region = region or client_instances.get_location()
 
-            name = f"projects/{project_id}/locations/{region}/services/{service_name}"
-
-            print(f"Getting details for Cloud Run service {service_name}...")
-            service = client.get_service(name=name)
-
-            # Parse container details
-            containers = []
-            if service.template and service.template.containers:
-                for container in service.template.containers:
-                    container_info = {
-                        "image": container.image,
-                        "resources": {
-                            "limits": dict(container.resources.limits)
-                            if container.resources and container.resources.limits
-                            else {}
-                        }
-                        if container.resources
-                        else {},
-                        "env_vars": {env.name: env.value for env in container.env}
-                        if container.env
-                        else {},
-                    }
-                    containers.append(container_info)
-
-            # Parse traffic
-            traffic_result = []
-            if service.traffic:
-                for traffic in service.traffic:
-                    traffic_info = {
-                        "type": traffic.type_.name
-                        if hasattr(traffic.type_, "name")
-                        else str(traffic.type_),
-                        "revision": traffic.revision.split("/")[-1]
-                        if traffic.revision
-                        else None,
-                        "percent": traffic.percent,
-                        "tag": traffic.tag,
+            logger.debug("Getting details for Cloud Run service %s...", service_name)
+            service = await _get_service(client, project_id, region, service_name)
+
+            return _dumps({"status": "success", **_to_dict(service)})
+        except Exception as e:
+            return _dumps({"status": "error", "message": str(e)})
+
+    @mcp_instance.tool()
+    async def describe_service_full(
+        service_name: str, project_id: str = None, region: str = None
+    ) -> str:
+        """
+        Get a Cloud Run service together with its revisions
+
+        Recommended over calling get_service and the revisions resource
+        separately: both reads are issued concurrently.
+
+        Args:
+            service_name: Name of the service
+            project_id: GCP project ID (defaults to configured project)
+            region: GCP region (e.g., us-central1) (defaults to configured location)
+        """
+        try:
+            # Get clients from client_instances
+            clients = client_instances.get_clients()
+            project_id = project_id or client_instances.get_project_id()
+            region = region or client_instances.get_location()
+
+            logger.debug("Describing Cloud Run service %s...", service_name)
+            service, revisions = await asyncio.gather(
+                _get_service(clients.run_async, project_id, region, service_name),
+                _list_revisions(
+                    clients.run_revisions_async, project_id, region, service_name
+                ),
+            )
+
+            return _dumps(
+                {
+                    "status": "success",
+                    **_to_dict(service),
+                    "revisions": [_to_dict(revision) for revision in revisions],
+                }
+            )
+        except Exception as e:
+            return _dumps({"status": "error", "message": str(e)})
+
+    @mcp_instance.tool()
+    async def get_operation_status(operation_name: str) -> str:
+        """
+        Check the progress of a Cloud Run create, update or delete operation
+
+        create_service, update_service and delete_service return as soon as the
+        operation starts; poll this until done is true.
+
+        Args:
+            operation_name: Operation name returned by the create/update/delete tool
+        """
+        try:
+            # Get client from client_instances
+            client = client_instances.get_clients().run_async
+            operation = await client.transport.operations_client.get_operation(
+                name=operation_name
+            )
+
+            if not operation.done:
+                return _dumps(
+                    {"status": "pending", "operation": operation.name, "done": False}
+                )
+
+            if operation.HasField("error"):
+                return _dumps(
+                    {
+                        "status": "error",
+                        "operation": operation.name,
+                        "done": True,
+                        "code": operation.error.code,
+                        "message": operation.error.message,
                     }
-                    traffic_result.append(traffic_info)
+                )
 
-            return json.dumps(
+            # Create, update and delete all resolve to the affected Service
+            service = run_v2.Service.deserialize(operation.response.value)
+            path = run_v2.ServicesClient.parse_service_path(service.name)
+            if path:
+                _invalidate_service(path["project"], path["location"], path["service"])
+
+            return _dumps(
                 {
                     "status": "success",
-                    "name": service.name.split("/")[-1],
+                    "operation": operation.name,
+                    "done": True,
+                    "name": service.name.rpartition("/")[2],
                     "uri": service.uri,
-                    "containers": containers,
-                    "traffic": traffic_result,
-                    "update_time": service.update_time.isoformat()
-                    if service.update_time
-                    else None,
-                },
-                indent=2,
+                    "conditions": [
+                        {
+                            "type": condition.type_,
+                            "state": _CONDITION_STATE_NAMES.get(
+                                condition.state, str(condition.state)
+                            ),
+                            "message": condition.message,
+                        }
+                        for condition in service.conditions
+                    ],
+                }
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     # Prompts
     @mcp_instance.prompt()
@@ -687,56 +722,25 @@ def register(mcp_instance):
         env_vars: str = "{}",
     ) -> str:
         """Prompt to deploy a Cloud Run service with the given configuration"""
-        return f"""
-I need to deploy a Cloud Run service with the following configuration:
-
-- Service name: {service_name}
-- Container image: {image}
-- Min instances: {min_instances}
-- Max instances: {max_instances}
-- Environment variables: {env_vars}
-
-Please help me set up this service and explain the deployment process and any best practices I should follow.
-"""
+        return _DEPLOY_SERVICE_PROMPT.format(
+            service_name=service_name,
+            image=image,
+            min_instances=min_instances,
+            max_instances=max_instances,
+            env_vars=env_vars,
+        )
 
     @mcp_instance.prompt()
     def check_service_status_prompt(service_name: str) -> str:
         """Prompt to check the status of a deployed Cloud Run service"""
-        return f"""
-I need to check the current status of my Cloud Run service named "{service_name}".
-
-Please provide me with:
-1. Is the service currently running?
-2. What is the URL to access it?
-3. What revision is currently serving traffic?
-4. Are there any issues with the service?
-"""
+        return _CHECK_SERVICE_STATUS_PROMPT.format(service_name=service_name)
 
     @mcp_instance.prompt()
     def create_service_prompt(region: str = "us-central1") -> str:
         """Prompt for creating a new Cloud Run service"""
-        return f"""
-I need to create a new Cloud Run service in {region}.
-
-Please help me with:
-1. What container image should I use?
-2. How much CPU and memory should I allocate?
-3. Should I set min and max instances for scaling?
-4. Do I need to set any environment variables?
-5. Should I allow unauthenticated access?
-6. What's the best way to deploy my service?
-"""
+        return _CREATE_SERVICE_PROMPT.format(region=region)
 
     @mcp_instance.prompt()
     def update_service_prompt() -> str:
         """Prompt for updating a Cloud Run service"""
-        return """
-I need to update my Cloud Run service.
-
-Please help me understand:
-1. How to update the container image
-2. How to change resource allocations
-3. How to add or modify environment variables
-4. How to update scaling settings
-5. Best practices for zero-downtime updates
-"""
+        return _UPDATE_SERVICE_PROMPT
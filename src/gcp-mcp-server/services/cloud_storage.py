@@ -1,9 +1,265 @@
-import json
+import base64
+import hashlib
+import itertools
+import logging
 import os
-from typing import Dict, Optional
-
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import google_crc32c
+import orjson
+from cachetools import TTLCache
+from google.api_core import exceptions
+from google.cloud.storage import Blob, transfer_manager
 from services import client_instances
 
+logger = logging.getLogger(__name__)
+
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+# Storage classes accepted by create_bucket, in the order they are listed
+_STORAGE_CLASSES = ("STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE")
+_VALID_STORAGE_CLASSES = frozenset(_STORAGE_CLASSES)
+
+# Bucket metadata rarely changes; serve back-to-back reads for a short while
+_BUCKET_CACHE = TTLCache(maxsize=1024, ttl=30)
+_BUCKET_LIST_CACHE = TTLCache(maxsize=64, ttl=30)
+
+# Partial-response projections for listings: only the fields the handlers
+# report. nextPageToken must stay in the projection or paging stops after the
+# first page.
+_LIST_BUCKET_FIELDS = (
+    "items(name,location,storageClass,timeCreated,versioning,labels),nextPageToken"
+)
+_LIST_BLOB_FIELDS = (
+    "items(name,size,updated,contentType,md5Hash,generation,metadata),nextPageToken"
+)
+
+
+# Object listing rows are a slotted dataclass, which orjson serializes natively
+# without building an intermediate dict per blob
+@dataclass(slots=True)
+class _BlobRow:
+    name: str
+    size: Optional[int]
+    updated: Optional[datetime]
+    content_type: Optional[str]
+    md5_hash: Optional[str]
+    generation: Optional[int]
+    metadata: Optional[Dict[str, str]]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool/resource result as indented JSON."""
+    return orjson.dumps(obj, option=_JSON_OPTS).decode()
+
+
+def _json_array(records: Iterable[Any], level: int = 0) -> orjson.Fragment:
+    """Serialize records one at a time into an indented JSON array.
+
+    Listings can run to many thousands of entries, so each record is encoded
+    as it is produced instead of collecting them into a list first. level is
+    the nesting depth the array will be embedded at; the result renders the
+    same as the list would through _dumps.
+    """
+    pad = b"\n" + b"  " * (level + 1)
+    buf = bytearray()
+    for record in records:
+        buf += b"," if buf else b"["
+        buf += pad
+        buf += orjson.dumps(record, option=_JSON_OPTS).replace(b"\n", pad)
+    buf += b"\n" + b"  " * level + b"]" if buf else b"[]"
+    return orjson.Fragment(bytes(buf))
+
+
+def _get_bucket(client, project_id: str, bucket_name: str):
+    """Fetch a Bucket, served from _BUCKET_CACHE while fresh."""
+    key = (project_id, bucket_name)
+    bucket = _BUCKET_CACHE.get(key)
+    if bucket is None:
+        bucket = client.get_bucket(bucket_name)
+        _BUCKET_CACHE[key] = bucket
+    return bucket
+
+
+def _list_buckets(client, project_id: str, prefix: str = "") -> List[Any]:
+    """List buckets matching a name prefix, cached in _BUCKET_LIST_CACHE."""
+    key = (project_id, prefix)
+    buckets = _BUCKET_LIST_CACHE.get(key)
+    if buckets is None:
+        buckets = list(
+            client.list_buckets(
+                project=project_id, prefix=prefix or None, fields=_LIST_BUCKET_FIELDS
+            )
+        )
+        _BUCKET_LIST_CACHE[key] = buckets
+    return buckets
+
+
+def _invalidate_buckets(project_id: str, bucket_name: str) -> None:
+    """Drop cached reads for a project's buckets after one is created."""
+    for key in [key for key in _BUCKET_LIST_CACHE if key[0] == project_id]:
+        _BUCKET_LIST_CACHE.pop(key, None)
+    _BUCKET_CACHE.pop((project_id, bucket_name), None)
+
+
+def _md5_matches(path: str, expected_b64: str) -> bool:
+    """Compare a local file's MD5 with an object's base64 md5Hash."""
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "md5").digest()
+    return base64.b64encode(digest).decode() == expected_b64
+
+
+def _crc32c_matches(path: str, expected_b64: str) -> bool:
+    """Compare a local file's CRC32C with an object's base64 crc32c."""
+    checksum = google_crc32c.Checksum()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode() == expected_b64
+
+
+def _prefetch_pages(iterator: Any) -> Iterator[Any]:
+    """Yield a paged listing's items, fetching the next page in the background.
+
+    Each page request is issued while the previous page's items are still
+    being serialized, so page round trips overlap with encoding.
+    """
+    pages = iterator.pages
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(next, pages, None)
+        while (page := future.result()) is not None:
+            items = list(page)
+            future = pool.submit(next, pages, None)
+            yield from items
+
+
+# Subrequests per batch request; the API accepts up to 100
+_BATCH_SIZE = 100
+
+# Uploads above the threshold, and downloads beyond their first chunk, are
+# transferred as concurrent chunks over the shared client's connection pool
+# rather than one sequential stream
+_PARALLEL_TRANSFER_THRESHOLD = 64 * 1024 * 1024
+_TRANSFER_CHUNK_SIZE = 32 * 1024 * 1024
+_TRANSFER_WORKERS = 8
+
+
+def _download_range(blob: Blob, path: str, start: int) -> int:
+    """Download the _TRANSFER_CHUNK_SIZE range of blob at start into path.
+
+    Returns the number of bytes written: short for the object's last chunk,
+    zero for a range that starts past its end.
+    """
+    with open(path, "r+b") as f:
+        f.seek(start)
+        try:
+            blob.download_to_file(
+                f, start=start, end=start + _TRANSFER_CHUNK_SIZE - 1, checksum=None
+            )
+        except exceptions.RequestRangeNotSatisfiable:
+            return 0
+        return f.tell() - start
+
+
+def _download_remaining_chunks(blob: Blob, path: str) -> None:
+    """Download the chunks after the first as concurrent ranged GETs.
+
+    The object size is not known without a metadata read, so chunks are
+    requested _TRANSFER_WORKERS at a time until one comes back short. Each
+    GET is pinned to the generation the first response reported.
+    """
+    step = _TRANSFER_WORKERS * _TRANSFER_CHUNK_SIZE
+    with ThreadPoolExecutor(max_workers=_TRANSFER_WORKERS) as pool:
+        for offset in itertools.count(_TRANSFER_CHUNK_SIZE, step):
+            starts = range(offset, offset + step, _TRANSFER_CHUNK_SIZE)
+            written = pool.map(lambda start: _download_range(blob, path, start), starts)
+            if min(written) < _TRANSFER_CHUNK_SIZE:
+                return
+
+
+def _download_blob(blob: Blob, path: str) -> bool:
+    """Download blob into the empty file at path.
+
+    The first chunk's ranged GET returns the whole of a small object, and a
+    full first chunk means there is more. Returns False if the file does not
+    match the object's CRC32C.
+    """
+    first = _download_range(blob, path, 0)
+    if not first or blob.content_encoding == "gzip":
+        # Empty objects have no byte range to request. Objects stored
+        # gzip-encoded are decompressed as they are written, while ranges and
+        # X-Goog-Hash refer to the stored bytes; fetch those whole, checked by
+        # the client itself
+        blob.download_to_filename(path)
+        return True
+    if first == _TRANSFER_CHUNK_SIZE:
+        _download_remaining_chunks(blob, path)
+    # Ranged GETs skip the client's checksum, so check the file against the
+    # object's CRC32C (present on every object)
+    return not blob.crc32c or _crc32c_matches(path, blob.crc32c)
+
+
+def _batched(
+    client, bucket_name: str, blob_names: List[str], call: Callable[[Any], Any]
+) -> Iterator[Tuple[str, Any]]:
+    """Run call(blob) for each name through the Storage batch API.
+
+    Each batch of up to _BATCH_SIZE calls goes out as one multipart request.
+    Yields (blob_name, subresponse) pairs in input order.
+    """
+    bucket = client.bucket(bucket_name)
+    for start in range(0, len(blob_names), _BATCH_SIZE):
+        names = blob_names[start : start + _BATCH_SIZE]
+        # raise_exception=False keeps per-object failures in the responses
+        # instead of raising the last one for the whole batch
+        batch = client.batch(raise_exception=False)
+        with batch:
+            for name in names:
+                call(bucket.blob(name))
+        # Leaving the block calls finish(), whose return value (one
+        # subresponse per deferred call) Batch keeps as _responses. This is
+        # the only place that reads it; checked against google-cloud-storage
+        # 3.x and covered by tests/test_cloud_storage.py
+        yield from zip(names, batch._responses)
+
+
+def _batch_error(bucket_name: str, blob_name: str, response: Any) -> str:
+    """Describe a failed batch subresponse in terms of the object it was for.
+
+    Subresponses carry no request URL, so exceptions.from_http_response would
+    only name the batch content ID.
+    """
+    try:
+        detail = response.json()["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        detail = response.reason
+    return f"{response.status_code} {detail}: gs://{bucket_name}/{blob_name}"
+
+
+def _delete_blobs(
+    client, bucket_name: str, blob_names: List[str]
+) -> Tuple[List[str], List[Dict[str, str]]]:
+    """Delete blobs in batches, returning (deleted names, failures)."""
+    deleted = []
+    failed = []
+    for name, response in _batched(
+        client, bucket_name, blob_names, lambda blob: blob.delete()
+    ):
+        if 200 <= response.status_code < 300:
+            deleted.append(name)
+        else:
+            failed.append(
+                {
+                    "blob_name": name,
+                    "message": _batch_error(bucket_name, name, response),
+                }
+            )
+    return deleted, failed
+
 
 def register(mcp_instance):
     """Register all Cloud Storage resources and tools with the MCP instance."""
@@ -17,26 +273,23 @@ def register(mcp_instance):
             client = client_instances.get_clients().storage
             project_id = project_id or client_instances.get_project_id()
 
-            buckets = client.list_buckets()
+            buckets = _list_buckets(client, project_id)
 
-            result = []
-            for bucket in buckets:
-                result.append(
+            return _dumps(
+                _json_array(
                     {
                         "name": bucket.name,
                         "location": bucket.location,
                         "storage_class": bucket.storage_class,
-                        "time_created": bucket.time_created.isoformat()
-                        if bucket.time_created
-                        else None,
+                        "time_created": bucket.time_created,
                         "versioning_enabled": bucket.versioning_enabled,
-                        "labels": dict(bucket.labels) if bucket.labels else {},
+                        "labels": bucket.labels,
                     }
+                    for bucket in buckets
                 )
-
-            return json.dumps(result, indent=2)
+            )
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource("gcp://storage/{project_id}/bucket/{bucket_name}")
     def get_bucket_resource(project_id: str = None, bucket_name: str = None) -> str:
@@ -46,23 +299,21 @@ def register(mcp_instance):
             client = client_instances.get_clients().storage
             project_id = project_id or client_instances.get_project_id()
 
-            bucket = client.get_bucket(bucket_name)
+            bucket = _get_bucket(client, project_id, bucket_name)
             result = {
                 "name": bucket.name,
                 "location": bucket.location,
                 "storage_class": bucket.storage_class,
-                "time_created": bucket.time_created.isoformat()
-                if bucket.time_created
-                else None,
+                "time_created": bucket.time_created,
                 "versioning_enabled": bucket.versioning_enabled,
                 "requester_pays": bucket.requester_pays,
-                "lifecycle_rules": bucket.lifecycle_rules,
+                "lifecycle_rules": list(bucket.lifecycle_rules),
                 "cors": bucket.cors,
-                "labels": dict(bucket.labels) if bucket.labels else {},
+                "labels": bucket.labels,
             }
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     @mcp_instance.resource("gcp://storage/{project_id}/bucket/{bucket_name}/objects")
     def list_objects_resource(project_id: str = None, bucket_name: str = None) -> str:
@@ -74,25 +325,24 @@ def register(mcp_instance):
             project_id = project_id or client_instances.get_project_id()
 
             bucket = client.get_bucket(bucket_name)
-            blobs = bucket.list_blobs(prefix=prefix)
-
-            result = []
-            for blob in blobs:
-                result.append(
-                    {
-                        "name": blob.name,
-                        "size": blob.size,
-                        "updated": blob.updated.isoformat() if blob.updated else None,
-                        "content_type": blob.content_type,
-                        "md5_hash": blob.md5_hash,
-                        "generation": blob.generation,
-                        "metadata": blob.metadata,
-                    }
+            blobs = bucket.list_blobs(prefix=prefix, fields=_LIST_BLOB_FIELDS)
+
+            return _dumps(
+                _json_array(
+                    _BlobRow(
+                        blob.name,
+                        blob.size,
+                        blob.updated,
+                        blob.content_type,
+                        blob.md5_hash,
+                        blob.generation,
+                        blob.metadata,
+                    )
+                    for blob in _prefetch_pages(blobs)
                 )
-
-            return json.dumps(result, indent=2)
+            )
         except Exception as e:
-            return json.dumps({"error": str(e)}, indent=2)
+            return _dumps({"error": str(e)})
 
     # Tools
     @mcp_instance.tool()
@@ -121,18 +371,16 @@ def register(mcp_instance):
             project_id = project_id or client_instances.get_project_id()
 
             # Validate storage class
-            valid_storage_classes = ["STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"]
-            if storage_class not in valid_storage_classes:
-                return json.dumps(
+            if storage_class not in _VALID_STORAGE_CLASSES:
+                return _dumps(
                     {
                         "status": "error",
-                        "message": f"Invalid storage class: {storage_class}. Valid classes are: {', '.join(valid_storage_classes)}",
+                        "message": f"Invalid storage class: {storage_class}. Valid classes are: {', '.join(_STORAGE_CLASSES)}",
                     },
-                    indent=2,
                 )
 
             # Log info (similar to ctx.info)
-            print(f"Creating bucket {bucket_name} in {location}...")
+            logger.debug("Creating bucket %s in %s...", bucket_name, location)
             bucket = client.bucket(bucket_name)
             bucket.create(location=location, storage_class=storage_class, labels=labels)
 
@@ -141,22 +389,21 @@ def register(mcp_instance):
                 bucket.versioning_enabled = True
                 bucket.patch()
 
-            return json.dumps(
+            _invalidate_buckets(project_id, bucket_name)
+
+            return _dumps(
                 {
                     "status": "success",
                     "name": bucket.name,
                     "location": bucket.location,
                     "storage_class": bucket.storage_class,
-                    "time_created": bucket.time_created.isoformat()
-                    if bucket.time_created
-                    else None,
+                    "time_created": bucket.time_created,
                     "versioning_enabled": bucket.versioning_enabled,
                     "url": f"gs://{bucket_name}/",
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
     def list_buckets(project_id: str = None, prefix: str = "") -> str:
@@ -173,34 +420,29 @@ def register(mcp_instance):
             project_id = project_id or client_instances.get_project_id()
 
             # Log info (similar to ctx.info)
-            print(f"Listing buckets in project {project_id}...")
+            logger.debug("Listing buckets in project %s...", project_id)
 
             # List buckets with optional prefix filter
-            if prefix:
-                buckets = [
-                    b for b in client.list_buckets() if b.name.startswith(prefix)
-                ]
-            else:
-                buckets = list(client.list_buckets())
+            buckets = _list_buckets(client, project_id, prefix)
 
-            result = []
-            for bucket in buckets:
-                result.append(
+            result = _json_array(
+                (
                     {
                         "name": bucket.name,
                         "location": bucket.location,
                         "storage_class": bucket.storage_class,
-                        "time_created": bucket.time_created.isoformat()
-                        if bucket.time_created
-                        else None,
+                        "time_created": bucket.time_created,
                     }
-                )
+                    for bucket in buckets
+                ),
+                level=1,
+            )
 
-            return json.dumps(
-                {"status": "success", "buckets": result, "count": len(result)}, indent=2
+            return _dumps(
+                {"status": "success", "buckets": result, "count": len(buckets)}
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
     def upload_object(
@@ -227,14 +469,15 @@ def register(mcp_instance):
             client = client_instances.get_clients().storage
             project_id = project_id or client_instances.get_project_id()
 
-            # Check if file exists
-            if not os.path.exists(source_file_path):
-                return json.dumps(
+            # Check if file exists; the same stat gives the size
+            try:
+                file_size = os.stat(source_file_path).st_size
+            except FileNotFoundError:
+                return _dumps(
                     {
                         "status": "error",
                         "message": f"File not found: {source_file_path}",
                     },
-                    indent=2,
                 )
 
             # Get bucket
@@ -255,16 +498,41 @@ def register(mcp_instance):
             if metadata:
                 blob.metadata = metadata
 
-            # Get file size for progress reporting
-            file_size = os.path.getsize(source_file_path)
-            print(
-                f"Uploading {source_file_path} ({file_size} bytes) to gs://{bucket_name}/{destination_blob_name}..."
+            logger.debug(
+                "Uploading %s (%d bytes) to gs://%s/%s...",
+                source_file_path,
+                file_size,
+                bucket_name,
+                destination_blob_name,
             )
 
             # Upload file
-            blob.upload_from_filename(source_file_path)
+            if file_size > _PARALLEL_TRANSFER_THRESHOLD:
+                # Threads rather than the default processes, so the chunks
+                # share this client; the XML multipart upload does not return
+                # the object resource, hence the reload
+                transfer_manager.upload_chunks_concurrently(
+                    source_file_path,
+                    blob,
+                    chunk_size=_TRANSFER_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=_TRANSFER_WORKERS,
+                )
+                blob.reload()
+            else:
+                blob.upload_from_filename(source_file_path)
 
-            return json.dumps(
+            # Check the stored object against the local file; composite
+            # (chunked) uploads carry no MD5, only a CRC32C
+            if blob.md5_hash and not _md5_matches(source_file_path, blob.md5_hash):
+                return _dumps(
+                    {
+                        "status": "error",
+                        "message": f"MD5 mismatch after upload: gs://{bucket_name}/{destination_blob_name}",
+                    },
+                )
+
+            return _dumps(
                 {
                     "status": "success",
                     "bucket": bucket_name,
@@ -272,14 +540,14 @@ def register(mcp_instance):
                     "size": blob.size,
                     "content_type": blob.content_type,
                     "md5_hash": blob.md5_hash,
+                    "md5_verified": bool(blob.md5_hash),
                     "generation": blob.generation,
                     "public_url": blob.public_url,
                     "gsutil_uri": f"gs://{bucket_name}/{destination_blob_name}",
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
     def download_object(
@@ -302,45 +570,61 @@ def register(mcp_instance):
             client = client_instances.get_clients().storage
             project_id = project_id or client_instances.get_project_id()
 
-            # Get bucket and blob
+            # Get bucket and blob; no metadata read, the download response
+            # headers fill in generation, content type, encoding and hashes
             bucket = client.bucket(bucket_name)
             blob = bucket.blob(source_blob_name)
 
-            # Check if blob exists
-            if not blob.exists():
-                return json.dumps(
-                    {
-                        "status": "error",
-                        "message": f"Object not found: gs://{bucket_name}/{source_blob_name}",
-                    },
-                    indent=2,
-                )
-
             # Create directory if doesn't exist
             os.makedirs(
                 os.path.dirname(os.path.abspath(destination_file_path)), exist_ok=True
             )
 
-            print(
-                f"Downloading gs://{bucket_name}/{source_blob_name} to {destination_file_path}..."
+            logger.debug(
+                "Downloading gs://%s/%s to %s...",
+                bucket_name,
+                source_blob_name,
+                destination_file_path,
             )
 
-            # Download file
-            blob.download_to_filename(destination_file_path)
-
-            return json.dumps(
+            # Download into a part file beside the destination, so an
+            # existing file is only replaced by a complete, verified download
+            part_path = f"{destination_file_path}.{uuid.uuid4().hex}.part"
+            try:
+                with open(part_path, "xb"):
+                    pass
+                if not _download_blob(blob, part_path):
+                    return _dumps(
+                        {
+                            "status": "error",
+                            "message": f"CRC32C mismatch after download: gs://{bucket_name}/{source_blob_name}",
+                        },
+                    )
+                size = os.path.getsize(part_path)
+                os.replace(part_path, destination_file_path)
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+
+            return _dumps(
                 {
                     "status": "success",
                     "bucket": bucket_name,
                     "blob_name": source_blob_name,
-                    "size": blob.size,
+                    "size": size,
                     "content_type": blob.content_type,
                     "downloaded_to": destination_file_path,
                 },
-                indent=2,
+            )
+        except exceptions.NotFound:
+            return _dumps(
+                {
+                    "status": "error",
+                    "message": f"Object not found: gs://{bucket_name}/{source_blob_name}",
+                },
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
 
     @mcp_instance.tool()
     def delete_object(bucket_name: str, blob_name: str, project_id: str = None) -> str:
@@ -361,20 +645,91 @@ def register(mcp_instance):
             bucket = client.bucket(bucket_name)
             blob = bucket.blob(blob_name)
 
-            print(f"Deleting gs://{bucket_name}/{blob_name}...")
+            logger.debug("Deleting gs://%s/%s...", bucket_name, blob_name)
 
             # Delete the blob
             blob.delete()
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "message": f"Successfully deleted gs://{bucket_name}/{blob_name}",
                 },
-                indent=2,
             )
         except Exception as e:
-            return json.dumps({"status": "error", "message": str(e)}, indent=2)
+            return _dumps({"status": "error", "message": str(e)})
+
+    @mcp_instance.tool()
+    def delete_objects(
+        bucket_name: str, blob_names: List[str], project_id: str = None
+    ) -> str:
+        """
+        Delete several objects from a Cloud Storage bucket
+
+        Deletes are sent through the batch API, up to 100 per request.
+
+        Args:
+            bucket_name: Name of the bucket
+            blob_names: Names of the blobs to delete
+            project_id: GCP project ID (defaults to configured project)
+        """
+        try:
+            # Get client from client_instances
+            client = client_instances.get_clients().storage
+            project_id = project_id or client_instances.get_project_id()
+
+            logger.debug(
+                "Deleting %d objects from gs://%s...", len(blob_names), bucket_name
+            )
+            deleted, failed = _delete_blobs(client, bucket_name, blob_names)
+
+            return _dumps(
+                {
+                    "status": "error" if failed and not deleted else "success",
+                    "deleted": deleted,
+                    "failed": failed,
+                }
+            )
+        except Exception as e:
+            return _dumps({"status": "error", "message": str(e)})
+
+    @mcp_instance.tool()
+    def objects_exist(
+        bucket_name: str, blob_names: List[str], project_id: str = None
+    ) -> str:
+        """
+        Check whether objects exist in a Cloud Storage bucket
+
+        Lookups are sent through the batch API, up to 100 per request.
+
+        Args:
+            bucket_name: Name of the bucket
+            blob_names: Names of the blobs to check
+            project_id: GCP project ID (defaults to configured project)
+        """
+        try:
+            # Get client from client_instances
+            client = client_instances.get_clients().storage
+            project_id = project_id or client_instances.get_project_id()
+
+            exists = {}
+            failed = []
+            for name, response in _batched(
+                client, bucket_name, blob_names, lambda blob: blob.reload()
+            ):
+                if 200 <= response.status_code < 300 or response.status_code == 404:
+                    exists[name] = response.status_code != 404
+                else:
+                    failed.append(
+                        {
+                            "blob_name": name,
+                            "message": _batch_error(bucket_name, name, response),
+                        }
+                    )
+
+            return _dumps({"status": "success", "exists": exists, "failed": failed})
+        except Exception as e:
+            return _dumps({"status": "error", "message": str(e)})
 
     # Prompts
     @mcp_instance.prompt()
@@ -0,0 +1,32 @@
+import pytest
+
+
+class Recorder:
+    """Stand-in for the FastMCP server that keeps the registered handlers."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, *args, **kwargs):
+        def decorator(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+
+        return decorator
+
+    resource = prompt = tool
+
+    def add_prompt(self, prompt):
+        pass
+
+
+@pytest.fixture
+def register_tools():
+    """Register a service module and return its handlers by function name."""
+
+    def register(module):
+        mcp = Recorder()
+        module.register(mcp)
+        return mcp.tools
+
+    return register
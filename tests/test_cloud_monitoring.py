@@ -0,0 +1,72 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from services import client_instances, cloud_monitoring
+
+
+class _FakeAlertPolicyAsyncClient:
+    """Records delete_alert_policy calls and how many overlapped."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.deleted = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def delete_alert_policy(self, name):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            self.deleted.append(name)
+            if name in self.failing:
+                raise RuntimeError(f"cannot delete {name}")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def alerts_client(monkeypatch):
+    client = _FakeAlertPolicyAsyncClient(
+        failing={"projects/test-project/alertPolicies/b"}
+    )
+    monkeypatch.setattr(
+        client_instances,
+        "get_clients",
+        lambda: SimpleNamespace(monitoring_alerts_async=client),
+    )
+    monkeypatch.setattr(client_instances, "get_project_id", lambda: "test-project")
+    return client
+
+
+@pytest.fixture
+def delete_alert_policies(register_tools):
+    return register_tools(cloud_monitoring)["delete_alert_policies"]
+
+
+def test_delete_alert_policies_deletes_each_id_once(
+    alerts_client, delete_alert_policies
+):
+    result = json.loads(asyncio.run(delete_alert_policies(["a", "b", "c", "d"])))
+
+    assert sorted(alerts_client.deleted) == [
+        "projects/test-project/alertPolicies/a",
+        "projects/test-project/alertPolicies/b",
+        "projects/test-project/alertPolicies/c",
+        "projects/test-project/alertPolicies/d",
+    ]
+    assert alerts_client.max_in_flight == 4
+    assert result["status"] == "success"
+    assert result["deleted"] == ["a", "c", "d"]
+    assert [failure["alert_id"] for failure in result["failed"]] == ["b"]
+
+
+def test_delete_alert_policies_respects_concurrency(
+    alerts_client, delete_alert_policies
+):
+    asyncio.run(delete_alert_policies(["a", "c", "d", "e"], concurrency=2))
+
+    assert len(alerts_client.deleted) == 4
+    assert alerts_client.max_in_flight == 2
@@ -0,0 +1,174 @@
+import base64
+import gzip
+import io
+import json
+import re
+from types import SimpleNamespace
+from urllib.parse import unquote
+
+import google_crc32c
+import pytest
+import requests
+import urllib3
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage
+from services import client_instances, cloud_storage
+
+
+class _FakeSession:
+    """Answers Cloud Storage JSON API requests for an in-memory bucket.
+
+    Batch calls look objects up by status: present, missing (404) or denied
+    (403). Media downloads serve media, which maps a name to its stored
+    bytes and content encoding.
+    """
+
+    is_mtls = False
+
+    def __init__(self, objects, media):
+        self.objects = objects
+        self.media = media
+        self.batches = []
+        self.downloads = []
+
+    def request(self, method, url, data=None, headers=None, timeout=None, **kwargs):
+        if "/download/storage/v1/" in url:
+            return self._download(url, headers)
+        assert url.endswith("/batch/storage/v1"), url
+        body = data.decode() if isinstance(data, bytes) else data
+        calls = re.findall(r"\n(GET|DELETE) \S*/storage/v1/b/[^/]+/o/([^?\s]+)", body)
+        self.batches.append(calls)
+        parts = [
+            self._subresponse(index, call_method, unquote(name))
+            for index, (call_method, name) in enumerate(calls)
+        ]
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["content-type"] = "multipart/mixed; boundary=b"
+        response._content = ("".join(parts) + "--b--").encode()
+        return response
+
+    def _download(self, url, headers):
+        name = unquote(re.search(r"/o/([^?]+)", url).group(1))
+        byte_range = headers.get("range")
+        self.downloads.append((name, byte_range))
+        response = requests.Response()
+        response.request = requests.Request("GET", url).prepare()
+        if name not in self.media:
+            response.status_code = 404
+            response._content = b'{"error": {"message": "No such object"}}'
+            return response
+        stored, encoding = self.media[name]
+        crc32c = base64.b64encode(google_crc32c.Checksum(stored).digest()).decode()
+        response.headers.update(
+            {"X-Goog-Hash": f"crc32c={crc32c}", "X-Goog-Generation": "7"}
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.status_code = 200
+        if byte_range:
+            start, end = map(int, byte_range.removeprefix("bytes=").split("-"))
+            stored = stored[start : end + 1]
+            response.status_code = 206
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(stored),
+            headers=dict(response.headers),
+            status=response.status_code,
+            preload_content=False,
+        )
+        return response
+
+    def _subresponse(self, index, method, name):
+        state = self.objects.get(name, "missing")
+        if state == "missing":
+            status, payload = "404 Not Found", {"error": {"message": "No such object"}}
+        elif state == "denied":
+            status, payload = "403 Forbidden", {"error": {"message": "Access denied"}}
+        elif method == "DELETE":
+            status, payload = "204 No Content", None
+        else:
+            status, payload = "200 OK", {"name": name}
+        content = json.dumps(payload) if payload is not None else ""
+        return (
+            f"--b\r\nContent-Type: application/http\r\n"
+            f"Content-ID: <response-{index}>\r\n\r\n"
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(content)}\r\n\r\n{content}\r\n"
+        )
+
+
+_TEXT = b"compressible text " * 64
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _FakeSession(
+        {f"obj{i}": "present" for i in range(120)},
+        {"notes.txt.gz": (gzip.compress(_TEXT), "gzip")},
+    )
+    session.objects.update({"locked": "denied"})
+    client = storage.Client(
+        project="test-project", credentials=AnonymousCredentials(), _http=session
+    )
+    monkeypatch.setattr(
+        client_instances,
+        "get_clients",
+        lambda: SimpleNamespace(storage=client),
+    )
+    monkeypatch.setattr(client_instances, "get_project_id", lambda: "test-project")
+    return session
+
+
+@pytest.fixture
+def tools(register_tools):
+    return register_tools(cloud_storage)
+
+
+def test_delete_objects_reports_each_failing_blob(session, tools):
+    names = [f"obj{i}" for i in range(120)] + ["gone", "locked"]
+
+    result = json.loads(tools["delete_objects"]("bk", names))
+
+    assert [len(calls) for calls in session.batches] == [100, 22]
+    assert result["status"] == "success"
+    assert result["deleted"] == names[:120]
+    assert result["failed"] == [
+        {"blob_name": "gone", "message": "404 No such object: gs://bk/gone"},
+        {"blob_name": "locked", "message": "403 Access denied: gs://bk/locked"},
+    ]
+
+
+def test_objects_exist_maps_404_to_false_and_names_other_failures(session, tools):
+    result = json.loads(tools["objects_exist"]("bk", ["obj1", "gone", "locked"]))
+
+    assert result["exists"] == {"obj1": True, "gone": False}
+    assert result["failed"] == [
+        {"blob_name": "locked", "message": "403 Access denied: gs://bk/locked"}
+    ]
+
+
+def test_download_object_fetches_gzip_encoded_objects_whole(session, tools, tmp_path):
+    destination = tmp_path / "notes.txt"
+
+    result = json.loads(
+        tools["download_object"]("bk", "notes.txt.gz", str(destination))
+    )
+
+    assert result["status"] == "success"
+    assert destination.read_bytes() == _TEXT
+    # The first ranged GET reveals the encoding; the object is then fetched
+    # whole and checked against the CRC32C of its stored, compressed bytes
+    assert session.downloads[-1] == ("notes.txt.gz", None)
+
+
+def test_download_object_leaves_existing_file_alone_when_missing(
+    session, tools, tmp_path
+):
+    destination = tmp_path / "report.csv"
+    destination.write_bytes(b"previous contents")
+
+    result = json.loads(tools["download_object"]("bk", "gone", str(destination)))
+
+    assert result == {"status": "error", "message": "Object not found: gs://bk/gone"}
+    assert destination.read_bytes() == b"previous contents"
+    assert [path.name for path in tmp_path.iterdir()] == ["report.csv"]
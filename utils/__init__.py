@@ -1,14 +1,24 @@
 """Utility functions for MCP server."""
 
-import json
 from typing import Any
 
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+# Pre-rendered envelopes; only the payload is serialized per call, re-indented
+# one level so the output matches dumping the whole envelope
+_SUCCESS_PREFIX = b'{\n  "status": "success",\n  "data": '
+_ERROR_PREFIX = b'{\n  "status": "error",\n  "message": '
+_SUFFIX = b"\n}"
+
 
 def format_json_response(data: Any) -> str:
     """Format data as a JSON string with consistent styling."""
-    return json.dumps({"status": "success", "data": data}, indent=2)
+    payload = orjson.dumps(data, option=_JSON_OPTIONS).replace(b"\n", b"\n  ")
+    return (_SUCCESS_PREFIX + payload + _SUFFIX).decode()
 
 
 def format_error_response(message: str) -> str:
     """Format error message as a JSON string."""
-    return json.dumps({"status": "error", "message": message}, indent=2)
+    return (_ERROR_PREFIX + orjson.dumps(message) + _SUFFIX).decode()